@@ -2,8 +2,10 @@
 
 import os
 import re
-from typing import Dict
-from src.gemini_client import GeminiClient
+from typing import Callable, Dict, Optional
+from src.gemini_client import get_client
+from src.io_utils import write_file
+from src.text_utils import echo_stream, strip_fences
 
 
 class CICDGenerator:
@@ -11,28 +13,42 @@ class CICDGenerator:
     
     def __init__(self):
         """Initialize CI/CD generator"""
-        self.client = GeminiClient()
+        self.client = get_client()
     
-    def generate(self, requirements: str, platform: str = "github") -> str:
+    def generate(self, requirements: str, platform: str = "github",
+                 on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """
         Generate CI/CD pipeline configuration
         
         Args:
             requirements: Natural language requirements
             platform: CI/CD platform (github, gitlab)
+            on_chunk: Optional callback receiving the raw AI output as it streams in
         
         Returns:
             str: Generated pipeline configuration
         """
         print(f"🚀 Generating {platform.upper()} CI/CD pipeline...")
         
-        # Generate using AI
-        pipeline = self.client.generate_cicd_pipeline(requirements, platform)
+        # Generate using AI, streaming the response to on_chunk if given
+        if on_chunk is None:
+            pipeline = self.client.generate_cicd_pipeline(requirements, platform)
+        else:
+            pipeline = "".join(echo_stream(self.client.generate_cicd_pipeline_stream(requirements, platform), on_chunk))
         
-        # Clean up formatting
-        pipeline = pipeline.replace('```yaml', '').replace('```', '').strip()
+        return self._process(pipeline)
+    
+    async def async_generate(self, requirements: str, platform: str = "github") -> str:
+        """Async variant of generate, for running generators concurrently"""
+        print(f"🚀 Generating {platform.upper()} CI/CD pipeline...")
         
-        return pipeline
+        pipeline = await self.client.agenerate_cicd_pipeline(requirements, platform)
+        
+        return self._process(pipeline)
+    
+    def _process(self, pipeline: str) -> str:
+        """Clean up raw AI output"""
+        return strip_fences(pipeline)
     
     def save_output(self, pipeline: str, output_dir: str, platform: str = "github"):
         """
@@ -55,7 +71,6 @@ class CICDGenerator:
             filepath = os.path.join(output_dir, "pipeline.yml")
             os.makedirs(output_dir, exist_ok=True)
         
-        with open(filepath, 'w') as f:
-            f.write(pipeline)
+        write_file(filepath, pipeline.encode('utf-8'))
         
         print(f"✅ Generated: {filepath}")
@@ -1,7 +1,10 @@
 """Dockerfile Generator"""
 
 import os
-from src.gemini_client import GeminiClient
+from typing import Callable, Optional
+from src.gemini_client import get_client
+from src.io_utils import print_lines, write_file
+from src.text_utils import echo_stream, strip_fences
 from src.validators import validate_dockerfile
 
 
@@ -10,25 +13,41 @@ class DockerGenerator:
     
     def __init__(self):
         """Initialize Docker generator"""
-        self.client = GeminiClient()
+        self.client = get_client()
     
-    def generate(self, requirements: str) -> str:
+    def generate(self, requirements: str, on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """
         Generate Dockerfile
         
         Args:
             requirements: Natural language requirements
+            on_chunk: Optional callback receiving the raw AI output as it streams in
         
         Returns:
             str: Generated Dockerfile content
         """
         print("🚀 Generating Dockerfile...")
         
-        # Generate using AI
-        dockerfile = self.client.generate_dockerfile(requirements)
+        # Generate using AI, streaming the response to on_chunk if given
+        if on_chunk is None:
+            dockerfile = self.client.generate_dockerfile(requirements)
+        else:
+            dockerfile = "".join(echo_stream(self.client.generate_dockerfile_stream(requirements), on_chunk))
         
+        return self._process(dockerfile)
+    
+    async def async_generate(self, requirements: str) -> str:
+        """Async variant of generate, for running generators concurrently"""
+        print("🚀 Generating Dockerfile...")
+        
+        dockerfile = await self.client.agenerate_dockerfile(requirements)
+        
+        return self._process(dockerfile)
+    
+    def _process(self, dockerfile: str) -> str:
+        """Clean up and validate raw AI output"""
         # Clean up formatting
-        dockerfile = dockerfile.replace('```dockerfile', '').replace('```', '').strip()
+        dockerfile = strip_fences(dockerfile)
         
         # Validate
         print("\n✅ Validating generated Dockerfile...")
@@ -62,11 +81,7 @@ class DockerGenerator:
         os.makedirs(output_dir, exist_ok=True)
         
         filepath = os.path.join(output_dir, "Dockerfile")
-        
-        with open(filepath, 'w') as f:
-            f.write(dockerfile)
-        
-        print(f"✅ Generated: {filepath}")
+        write_file(filepath, dockerfile.encode('utf-8'))
         
         # Also generate .dockerignore
         dockerignore = """# Git
@@ -105,7 +120,9 @@ build/
 """
         
         dockerignore_path = os.path.join(output_dir, ".dockerignore")
-        with open(dockerignore_path, 'w') as f:
-            f.write(dockerignore)
+        write_file(dockerignore_path, dockerignore.encode('utf-8'))
         
-        print(f"✅ Generated: {dockerignore_path}")
+        print_lines([
+            f"✅ Generated: {filepath}",
+            f"✅ Generated: {dockerignore_path}",
+        ])
@@ -1,87 +1,37 @@
 """Documentation Generator for Implementation Guides"""
 
+import io
 import os
-from typing import Dict
-
-
-class DocumentationGenerator:
-    """Generator for implementation guides and documentation"""
-    
-    def generate_implementation_guide(
-        self, 
-        infra_type: str, 
-        generated_files: Dict[str, str],
-        requirements: str
-    ) -> str:
-        """
-        Generate comprehensive implementation guide
-        
-        Args:
-            infra_type: Type of infrastructure (kubernetes, terraform, docker, cicd)
-            generated_files: Dict of generated files
-            requirements: Original requirements
-        
-        Returns:
-            str: Implementation guide content
-        """
-        guide = f"""# Implementation Guide: {infra_type.title()}
-
-## Overview
-
-This guide explains the infrastructure code that was generated based on your requirements.
-
-### Requirements
-```
-{requirements}
-```
-
-## Generated Files
-
-"""
-        
-        # List generated files
-        for filename in generated_files.keys():
-            guide += f"- **{filename}**: "
-            
-            # Add description based on filename
-            if "deployment" in filename.lower():
-                guide += "Kubernetes Deployment manifest for pod management\n"
-            elif "service" in filename.lower():
-                guide += "Kubernetes Service for networking and load balancing\n"
-            elif "configmap" in filename.lower():
-                guide += "Kubernetes ConfigMap for configuration management\n"
-            elif "main.tf" in filename.lower():
-                guide += "Main Terraform configuration with infrastructure resources\n"
-            elif "variables.tf" in filename.lower():
-               guide += "Terraform input variables for customization\n"
-            elif "outputs.tf" in filename.lower():
-                guide += "Terraform outputs for resource information\n"
-            elif "dockerfile" in filename.lower():
-                guide += "Optimized multi-stage Dockerfile for building container images\n"
-            elif "workflow" in filename.lower() or "ci" in filename.lower():
-                guide += "CI/CD pipeline configuration for automated deployments\n"
-            else:
-                guide += "Generated infrastructure configuration\n"
-        
-        # Add deployment instructions
-        if infra_type == "kubernetes":
-            guide += self._kubernetes_deployment_guide()
-        elif infra_type == "terraform":
-            guide += self._terraform_deployment_guide()
-        elif infra_type == "docker":
-            guide += self._docker_deployment_guide()
-        elif infra_type == "cicd":
-            guide += self._cicd_deployment_guide()
-        
-        # Add common sections
-        guide += self._security_checklist(infra_type)
-        guide += self._customization_guide(infra_type)
-        guide += self._official_documentation_links(infra_type)
-        
-        return guide
-    
-    def _kubernetes_deployment_guide(self) -> str:
-        return """
+import re
+from string import Template
+from typing import Dict, Final, Iterable, Tuple
+from src.io_utils import write_file
+
+
+# Descriptions for generated files, keyed by filename keyword in order of precedence
+_FILE_DESCRIPTIONS = {
+    "deployment": "Kubernetes Deployment manifest for pod management\n",
+    "service": "Kubernetes Service for networking and load balancing\n",
+    "configmap": "Kubernetes ConfigMap for configuration management\n",
+    "main.tf": "Main Terraform configuration with infrastructure resources\n",
+    "variables.tf": "Terraform input variables for customization\n",
+    "outputs.tf": "Terraform outputs for resource information\n",
+    "dockerfile": "Optimized multi-stage Dockerfile for building container images\n",
+    "workflow": "CI/CD pipeline configuration for automated deployments\n",
+    "ci": "CI/CD pipeline configuration for automated deployments\n",
+}
+_DEFAULT_FILE_DESCRIPTION = "Generated infrastructure configuration\n"
+
+# One case-insensitive pass over the filename. Each keyword is its own
+# alternative anchored at the start, so earlier keywords still take
+# precedence over later ones regardless of where they appear in the name.
+_FILE_DESCRIPTION_RE = re.compile(
+    "^(?:" + "|".join(f".*?({re.escape(key)})" for key in _FILE_DESCRIPTIONS) + ")",
+    re.IGNORECASE | re.DOTALL
+)
+_FILE_DESCRIPTION_VALUES = tuple(_FILE_DESCRIPTIONS.values())
+
+_KUBERNETES_GUIDE: Final[str] = """
 ## How to Deploy
 
 ### Prerequisites
@@ -126,9 +76,8 @@ This guide explains the infrastructure code that was generated based on your req
    ```
 
 """
-    
-    def _terraform_deployment_guide(self) -> str:
-        return """
+
+_TERRAFORM_GUIDE: Final[str] = """
 ## How to Deploy
 
 ### Prerequisites
@@ -164,9 +113,8 @@ This guide explains the infrastructure code that was generated based on your req
    ```
 
 """
-    
-    def _docker_deployment_guide(self) -> str:
-        return """
+
+_DOCKER_GUIDE: Final[str] = """
 ## How to Build and Run
 
 ### Build the Image
@@ -189,9 +137,8 @@ docker push your-registry/your-app:latest
 ```
 
 """
-    
-    def _cicd_deployment_guide(self) -> str:
-        return """
+
+_CICD_GUIDE: Final[str] = """
 ## How to Use the Pipeline
 
 ### Setup
@@ -207,9 +154,8 @@ docker push your-registry/your-app:latest
 - Kubernetes cluster access (if deploying to K8s)
 
 """
-    
-    def _security_checklist(self, infra_type: str) -> str:
-        return """
+
+_SECURITY_CHECKLIST: Final[str] = """
 ## Security Checklist
 
 The generated code implements these security best practices:
@@ -230,9 +176,8 @@ The generated code implements these security best practices:
 - Use secrets management (Vault, AWS Secrets Manager, etc.)
 
 """
-    
-    def _customization_guide(self, infra_type: str) -> str:
-        return """
+
+_CUSTOMIZATION_GUIDE: Final[str] = """
 ## How to Customize
 
 ### Common Customizations
@@ -251,15 +196,13 @@ The generated code implements these security best practices:
 - Keep security best practices in mind
 
 """
-    
-    def _official_documentation_links(self, infra_type: str) -> str:
-        guide = """
+
+_DOC_LINKS_HEADER: Final[str] = """
 ## Official Documentation References
 
 """
-        
-        if infra_type == "kubernetes":
-            guide += """
+
+_DOC_LINKS_K8S: Final[str] = """
 ### Kubernetes Documentation
 
 - [Deployments](https://kubernetes.io/docs/concepts/workloads/controllers/deployment/)
@@ -270,8 +213,8 @@ The generated code implements these security best practices:
 - [Health Checks](https://kubernetes.io/docs/tasks/configure-pod-container/configure-liveness-readiness-startup-probes/)
 - [Best Practices](https://kubernetes.io/docs/concepts/configuration/overview/)
 """
-        elif infra_type == "terraform":
-            guide += """
+
+_DOC_LINKS_TF: Final[str] = """
 ### Terraform Documentation
 
 - [AWS Provider](https://registry.terraform.io/providers/hashicorp/aws/latest/docs)
@@ -280,8 +223,8 @@ The generated code implements these security best practices:
 - [Outputs](https://developer.hashicorp.com/terraform/language/values/outputs)
 - [Best Practices](https://www.terraform-best-practices.com/)
 """
-        elif infra_type == "docker":
-            guide += """
+
+_DOC_LINKS_DOCKER: Final[str] = """
 ### Docker Documentation
 
 - [Dockerfile Reference](https://docs.docker.com/engine/reference/builder/)
@@ -289,14 +232,117 @@ The generated code implements these security best practices:
 - [Best Practices](https://docs.docker.com/develop/dev-best-practices/dockerfile-best-practices/)
 - [Security](https://docs.docker.com/engine/security/)
 """
-        
-        guide += """
+
+_DOC_LINKS_FOOTER: Final[str] = """
 
 ---
 
 *Generated by InfraAgent - Built with Cline for the AI Agents Assemble Hackathon*
 """
-        return guide
+
+# Complete "Official Documentation References" section per infra type
+_DOC_LINKS: Final[Dict[str, str]] = {
+    "kubernetes": _DOC_LINKS_HEADER + _DOC_LINKS_K8S + _DOC_LINKS_FOOTER,
+    "terraform": _DOC_LINKS_HEADER + _DOC_LINKS_TF + _DOC_LINKS_FOOTER,
+    "docker": _DOC_LINKS_HEADER + _DOC_LINKS_DOCKER + _DOC_LINKS_FOOTER,
+}
+_DOC_LINKS_DEFAULT: Final[str] = _DOC_LINKS_HEADER + _DOC_LINKS_FOOTER
+
+_GUIDE_HEAD: Final[Template] = Template("""# Implementation Guide: $title
+
+## Overview
+
+This guide explains the infrastructure code that was generated based on your requirements.
+
+### Requirements
+```
+$requirements
+```
+
+## Generated Files
+
+""")
+
+_DEPLOYMENT_GUIDES: Final[Dict[str, str]] = {
+    "kubernetes": _KUBERNETES_GUIDE,
+    "terraform": _TERRAFORM_GUIDE,
+    "docker": _DOCKER_GUIDE,
+    "cicd": _CICD_GUIDE,
+}
+
+# Everything after the file list depends only on the infra type, so it is
+# assembled once per type here instead of on every call
+_GUIDE_TAILS: Final[Dict[str, str]] = {
+    infra_type: (deployment_guide + _SECURITY_CHECKLIST + _CUSTOMIZATION_GUIDE
+                 + _DOC_LINKS.get(infra_type, _DOC_LINKS_DEFAULT))
+    for infra_type, deployment_guide in _DEPLOYMENT_GUIDES.items()
+}
+_GUIDE_TAIL_DEFAULT: Final[str] = _SECURITY_CHECKLIST + _CUSTOMIZATION_GUIDE + _DOC_LINKS_DEFAULT
+
+
+class DocumentationGenerator:
+    """Generator for implementation guides and documentation"""
+    
+    def generate_implementation_guide(
+        self, 
+        infra_type: str, 
+        generated_files: Dict[str, str],
+        requirements: str
+    ) -> str:
+        """
+        Generate comprehensive implementation guide
+        
+        Args:
+            infra_type: Type of infrastructure (kubernetes, terraform, docker, cicd)
+            generated_files: Dict of generated files
+            requirements: Original requirements
+        
+        Returns:
+            str: Implementation guide content
+        """
+        return self.assemble_guide(self.guide_sections(infra_type, requirements), generated_files)
+    
+    def guide_sections(self, infra_type: str, requirements: str) -> Tuple[str, str]:
+        """
+        Render the parts of the guide that do not depend on the generated files
+        
+        Only the file list needs the generator's output, so commands render
+        these sections up front and merge the file list in once generation
+        has finished.
+        
+        Args:
+            infra_type: Type of infrastructure (kubernetes, terraform, docker, cicd)
+            requirements: Original requirements
+        
+        Returns:
+            Tuple[str, str]: Text before and after the generated file list
+        """
+        head = _GUIDE_HEAD.substitute(title=infra_type.title(), requirements=requirements)
+        return head, _GUIDE_TAILS.get(infra_type, _GUIDE_TAIL_DEFAULT)
+    
+    def assemble_guide(self, sections: Tuple[str, str], generated_files: Iterable[str]) -> str:
+        """
+        Merge the generated file list into pre-rendered guide sections
+        
+        Args:
+            sections: (head, tail) from guide_sections
+            generated_files: Generated filenames (or a dict keyed by filename)
+        
+        Returns:
+            str: Implementation guide content
+        """
+        head, tail = sections
+        guide = io.StringIO()
+        guide.write(head)
+        
+        # List generated files with a description based on filename
+        for filename in generated_files:
+            match = _FILE_DESCRIPTION_RE.match(filename)
+            description = _FILE_DESCRIPTION_VALUES[match.lastindex - 1] if match else _DEFAULT_FILE_DESCRIPTION
+            guide.write(f"- **{filename}**: {description}")
+        
+        guide.write(tail)
+        return guide.getvalue()
     
     def save_guide(self, guide: str, output_dir: str):
         """Save implementation guide to file"""
@@ -304,7 +350,6 @@ The generated code implements these security best practices:
         
         filepath = os.path.join(output_dir, "IMPLEMENTATION_GUIDE.md")
         
-        with open(filepath, 'w') as f:
-            f.write(guide)
+        write_file(filepath, guide.encode('utf-8'))
         
         print(f"✅ Generated: {filepath}")
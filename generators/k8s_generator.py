@@ -2,52 +2,140 @@
 
 import os
 import re
-from typing import Dict, List
-from src.gemini_client import GeminiClient
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from src.gemini_client import get_client
+from src.io_utils import print_lines, write_file
+from src.text_utils import echo_stream, strip_fences
 from src.validators import validate_kubernetes_manifest
 
+# File markers emitted by the model: "---\n# FILE: name.yaml"
+_FILE_RE = re.compile(r'---\s*\n#\s*FILE:\s*(\S+)\s*\n')
+_KIND_RE = re.compile(r'kind:\s*(\w+)')
+
 
 class K8sGenerator:
     """Generator for Kubernetes manifests"""
     
     def __init__(self):
         """Initialize Kubernetes generator"""
-        self.client = GeminiClient()
+        self.client = get_client()
     
-    def generate(self, requirements: str) -> Dict[str, str]:
+    def generate(self, requirements: str,
+                 on_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, str]:
         """
         Generate Kubernetes manifests
         
         Args:
             requirements: Natural language requirements
+            on_chunk: Optional callback receiving the raw AI output as it streams in
         
         Returns:
             Dict mapping filename to content
         """
+        return dict(self.generate_stream(requirements, on_chunk))
+    
+    def generate_stream(self, requirements: str,
+                        on_chunk: Optional[Callable[[str], None]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Generate Kubernetes manifests, yielding each file as soon as it is complete
+        
+        Manifests are validated in the background while the rest of the
+        response is still streaming in; the report is printed at the end.
+        
+        Args:
+            requirements: Natural language requirements
+            on_chunk: Optional callback receiving the raw AI output as it streams in
+        
+        Yields:
+            (filename, content) tuples
+        """
         print("🚀 Generating Kubernetes manifests...")
         
-        # Generate YAML using AI
-        raw_output = self.client.generate_kubernetes_yaml(requirements)
+        # Stream YAML from the AI and split files as their markers arrive
+        chunks = self.client.generate_kubernetes_yaml_stream(requirements)
+        if on_chunk is not None:
+            chunks = echo_stream(chunks, on_chunk)
         
+        with ThreadPoolExecutor() as executor:
+            pending = []
+            for filename, content in self._iter_manifests(chunks):
+                pending.append((filename, executor.submit(validate_kubernetes_manifest, content)))
+                yield filename, content
+            
+            print("\n✅ Validating generated manifests...")
+            for filename, future in pending:
+                self._report(filename, future.result())
+    
+    async def async_generate(self, requirements: str) -> Dict[str, str]:
+        """Async variant of generate, for running generators concurrently"""
+        print("🚀 Generating Kubernetes manifests...")
+        
+        raw_output = await self.client.agenerate_kubernetes_yaml(requirements)
+        
+        return self._process(raw_output)
+    
+    def _process(self, raw_output: str) -> Dict[str, str]:
+        """Parse and validate raw AI output"""
         # Parse output into separate files
         manifests = self._parse_output(raw_output)
         
-        # Validate each manifest
+        # Validate each manifest (independent, so validate them in parallel)
         print("\n✅ Validating generated manifests...")
-        for filename, content in manifests.items():
-            result = validate_kubernetes_manifest(content)
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(validate_kubernetes_manifest, manifests.values()))
+        
+        for filename, result in zip(manifests.keys(), results):
+            self._report(filename, result)
+        
+        return manifests
+    
+    def _report(self, filename: str, result):
+        """Print validation errors and warnings for a manifest"""
+        if not result.valid:
+            print(f"\n⚠️  Validation errors in {filename}:")
+            for error in result.errors:
+                print(f"   ❌ {error}")
+        
+        if result.warnings:
+            print(f"\n⚠️  Warnings for {filename}:")
+            for warning in result.warnings:
+                print(f"   ⚠️  {warning}")
+    
+    def _iter_manifests(self, chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Incrementally split streamed AI output into separate YAML files
+        
+        A file is emitted as soon as the next file marker (or the end of the
+        stream) is seen. Output without any markers falls back to _parse_output.
+        
+        Args:
+            chunks: Text chunks of the raw AI output
+        
+        Yields:
+            (filename, content) tuples
+        """
+        buffer = ""
+        filename = None
+        
+        for chunk in chunks:
+            buffer += chunk
             
-            if not result.valid:
-                print(f"\n⚠️  Validation errors in {filename}:")
-                for error in result.errors:
-                    print(f"   ❌ {error}")
+            body_start = 0
+            for match in _FILE_RE.finditer(buffer):
+                if filename is not None:
+                    yield filename, strip_fences(buffer[body_start:match.start()])
+                filename = match.group(1).strip()
+                body_start = match.end()
             
-            if result.warnings:
-                print(f"\n⚠️  Warnings for {filename}:")
-                for warning in result.warnings:
-                    print(f"   ⚠️  {warning}")
+            # Only keep the body of the file currently being streamed
+            if filename is not None:
+                buffer = buffer[body_start:]
         
-        return manifests
+        if filename is not None:
+            yield filename, strip_fences(buffer)
+        else:
+            yield from self._parse_output(buffer).items()
     
     def _parse_output(self, output: str) -> Dict[str, str]:
         """
@@ -62,17 +150,14 @@ class K8sGenerator:
         manifests = {}
         
         # Split by file markers
-        file_pattern = r'---\s*\n#\s*FILE:\s*(\S+)\s*\n'
-        splits = re.split(file_pattern, output)
+        splits = _FILE_RE.split(output)
         
         # Process splits (pattern: [prefix, filename1, content1, filename2, content2, ...])
         for i in range(1, len(splits), 2):
             if i + 1 < len(splits):
                 filename = splits[i].strip()
-                content = splits[i + 1].strip()
-                
                 # Clean up common formatting
-                content = content.replace('```yaml', '').replace('```', '').strip()
+                content = strip_fences(splits[i + 1])
                 
                 manifests[filename] = content
         
@@ -84,10 +169,10 @@ class K8sGenerator:
                 # Try to determine filename from kind
                 try:
                     # Remove markdown code blocks if present
-                    doc = doc.replace('```yaml', '').replace('```', '').strip()
+                    doc = strip_fences(doc)
                     
                     # Extract kind
-                    kind_match = re.search(r'kind:\s*(\w+)', doc)
+                    kind_match = _KIND_RE.search(doc)
                     if kind_match:
                         kind = kind_match.group(1).lower()
                         filename = f"{kind}.yaml"
@@ -99,20 +184,35 @@ class K8sGenerator:
         
         return manifests
     
-    def save_outputs(self, manifests: Dict[str, str], output_dir: str):
+    def save_outputs(
+        self,
+        manifests: Union[Dict[str, str], Iterable[Tuple[str, str]]],
+        output_dir: str
+    ) -> Dict[str, str]:
         """
         Save generated manifests to files
         
         Args:
-            manifests: Dict mapping filename to content
+            manifests: Dict mapping filename to content, or an iterable of
+                (filename, content) tuples such as generate_stream()
             output_dir: Output directory path
+        
+        Returns:
+            Dict mapping filename to content of everything written
         """
         os.makedirs(output_dir, exist_ok=True)
         
-        for filename, content in manifests.items():
+        if isinstance(manifests, dict):
+            manifests = manifests.items()
+        
+        saved = {}
+        log = []
+        for filename, content in manifests:
             filepath = os.path.join(output_dir, filename)
-            
-            with open(filepath, 'w') as f:
-                f.write(content)
-            
-            print(f"✅ Generated: {filepath}")
+            write_file(filepath, content.encode('utf-8'))
+            log.append(f"✅ Generated: {filepath}")
+            saved[filename] = content
+        
+        print_lines(log)
+        
+        return saved
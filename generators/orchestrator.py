@@ -0,0 +1,46 @@
+"""Concurrent orchestration of the infrastructure generators"""
+
+import asyncio
+from typing import Any, Dict, Optional
+from generators.k8s_generator import K8sGenerator
+from generators.terraform_generator import TerraformGenerator
+from generators.docker_generator import DockerGenerator
+from generators.cicd_generator import CICDGenerator
+
+
+async def generate_all(
+    k8s_requirements: Optional[str] = None,
+    terraform_requirements: Optional[str] = None,
+    docker_requirements: Optional[str] = None,
+    cicd_requirements: Optional[str] = None,
+    platform: str = "github"
+) -> Dict[str, Any]:
+    """
+    Run the requested generators concurrently
+
+    Each generator waits on its own Gemini request, so running them together
+    takes as long as the slowest one instead of the sum of all of them.
+
+    Args:
+        k8s_requirements: Requirements for Kubernetes manifests (skipped if None)
+        terraform_requirements: Requirements for Terraform code (skipped if None)
+        docker_requirements: Requirements for the Dockerfile (skipped if None)
+        cicd_requirements: Requirements for the CI/CD pipeline (skipped if None)
+        platform: CI/CD platform (github, gitlab)
+
+    Returns:
+        Dict mapping infrastructure type to the generator's output
+    """
+    tasks = {}
+
+    if k8s_requirements is not None:
+        tasks["kubernetes"] = K8sGenerator().async_generate(k8s_requirements)
+    if terraform_requirements is not None:
+        tasks["terraform"] = TerraformGenerator().async_generate(terraform_requirements)
+    if docker_requirements is not None:
+        tasks["docker"] = DockerGenerator().async_generate(docker_requirements)
+    if cicd_requirements is not None:
+        tasks["cicd"] = CICDGenerator().async_generate(cicd_requirements, platform)
+
+    results = await asyncio.gather(*tasks.values())
+    return dict(zip(tasks.keys(), results))
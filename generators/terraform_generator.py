@@ -2,33 +2,55 @@
 
 import os
 import re
-from typing import Dict
-from src.gemini_client import GeminiClient
+from typing import Callable, Dict, Optional
+from src.gemini_client import get_client
+from src.io_utils import print_lines, write_file
+from src.text_utils import echo_stream, strip_fences
 from src.validators import validate_terraform_syntax
 
+# File markers emitted by the model: "---\n# FILE: name.tf"
+_FILE_RE = re.compile(r'---\s*\n#\s*FILE:\s*(\S+)\s*\n')
+
 
 class TerraformGenerator:
     """Generator for Terraform infrastructure code"""
     
     def __init__(self):
         """Initialize Terraform generator"""
-        self.client = GeminiClient()
+        self.client = get_client()
     
-    def generate(self, requirements: str) -> Dict[str, str]:
+    def generate(self, requirements: str,
+                 on_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, str]:
         """
         Generate Terraform code
         
         Args:
             requirements: Natural language requirements
+            on_chunk: Optional callback receiving the raw AI output as it streams in
         
         Returns:
             Dict mapping filename to content
         """
         print("🚀 Generating Terraform code...")
         
-        # Generate using AI
-        raw_output = self.client.generate_terraform_code(requirements)
+        # Generate using AI, streaming the response to on_chunk if given
+        if on_chunk is None:
+            raw_output = self.client.generate_terraform_code(requirements)
+        else:
+            raw_output = "".join(echo_stream(self.client.generate_terraform_code_stream(requirements), on_chunk))
+        
+        return self._process(raw_output)
+    
+    async def async_generate(self, requirements: str) -> Dict[str, str]:
+        """Async variant of generate, for running generators concurrently"""
+        print("🚀 Generating Terraform code...")
+        
+        raw_output = await self.client.agenerate_terraform_code(requirements)
         
+        return self._process(raw_output)
+    
+    def _process(self, raw_output: str) -> Dict[str, str]:
+        """Parse and validate raw AI output"""
         # Parse output into separate files
         tf_files = self._parse_output(raw_output)
         
@@ -62,23 +84,20 @@ class TerraformGenerator:
         tf_files = {}
         
         # Split by file markers
-        file_pattern = r'---\s*\n#\s*FILE:\s*(\S+)\s*\n'
-        splits = re.split(file_pattern, output)
+        splits = _FILE_RE.split(output)
         
         # Process splits
         for i in range(1, len(splits), 2):
             if i + 1 < len(splits):
                 filename = splits[i].strip()
-                content = splits[i + 1].strip()
-                
                 # Clean up formatting
-                content = content.replace('```hcl', '').replace('```terraform', '').replace('```', '').strip()
+                content = strip_fences(splits[i + 1])
                 
                 tf_files[filename] = content
         
         # If no file markers, create default files
         if not tf_files:
-            output = output.replace('```hcl', '').replace('```terraform', '').replace('```', '').strip()
+            output = strip_fences(output)
             tf_files['main.tf'] = output
         
         return tf_files
@@ -93,10 +112,12 @@ class TerraformGenerator:
         """
         os.makedirs(output_dir, exist_ok=True)
         
-        for filename, content in tf_files.items():
+        encoded = [(filename, content.encode('utf-8')) for filename, content in tf_files.items()]
+        
+        log = []
+        for filename, data in encoded:
             filepath = os.path.join(output_dir, filename)
-            
-            with open(filepath, 'w') as f:
-                f.write(content)
-            
-            print(f"✅ Generated: {filepath}")
+            write_file(filepath, data)
+            log.append(f"✅ Generated: {filepath}")
+        
+        print_lines(log)
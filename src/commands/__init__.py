@@ -0,0 +1,24 @@
+"""CLI subcommands, imported on demand by src.cli.LazyGroup"""
+
+from typing import Callable, Optional
+
+import click
+
+# Application types accepted by --app (generate-k8s, generate-docker)
+APP_TYPES = ['python', 'nodejs', 'java', 'go', 'flask', 'django']
+
+
+def stream_echo(ctx: click.Context) -> Optional[Callable[[str], None]]:
+    """
+    Get the callback that echoes the AI response as it streams in
+
+    Args:
+        ctx: Click context of the running subcommand
+
+    Returns:
+        Callable echoing each chunk, or None when streaming is turned off (--no-stream)
+    """
+    if not (ctx.obj or {}).get("stream"):
+        return None
+
+    return lambda chunk: click.echo(chunk, nl=False)
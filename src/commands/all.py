@@ -0,0 +1,122 @@
+"""Combined generation command running every generator concurrently"""
+
+import os
+import click
+from src import config
+from src.commands import APP_TYPES
+from src.prompts import CICD_TEMPLATE, DOCKER_TEMPLATE, K8S_TEMPLATE, TERRAFORM_TEMPLATE
+
+
+@click.command(name="generate-all", hidden=True)
+@click.option('--app', required=True, type=click.Choice(APP_TYPES, case_sensitive=False), help='Application type')
+@click.option('--port', default=8080, help='Container port')
+@click.option('--replicas', default=3, help='Number of replicas')
+@click.option('--memory', default='512Mi', help='Memory limit')
+@click.option('--cpu', default='250m', help='CPU limit')
+@click.option('--base-image', default=None, help='Base image (e.g., python:3.11-slim)')
+@click.option('--cloud', type=click.Choice(['aws', 'azure', 'gcp'], case_sensitive=False), default='aws', help='Cloud provider')
+@click.option('--service', default='vpc', help='Service to deploy (vpc, rds, eks, etc.)')
+@click.option('--region', default='us-east-1', help='Cloud region')
+@click.option('--platform', type=click.Choice(['github', 'gitlab']), default='github', help='CI/CD platform')
+@click.option('--deploy-target', default='kubernetes', help='Deployment target (kubernetes, aws, docker)')
+@click.option('--output', default=lambda: config.OUTPUT_DIR, help='Output directory')
+def generate_all(app, port, replicas, memory, cpu, base_image, cloud, service, region,
+                 platform, deploy_target, output):
+    """
+    Generate Kubernetes, Terraform, Docker and CI/CD code in one run
+
+    The four Gemini requests run concurrently, so the run takes about as long
+    as the slowest generator. Each type is saved to its own subdirectory of
+    the output directory, with its own implementation guide.
+
+    Example:
+        infraagent generate-all --app flask --cloud aws --platform github
+    """
+    click.echo("\n".join([
+        "=" * 60,
+        "🚀 InfraAgent - Full Stack Generator",
+        "=" * 60,
+    ]))
+
+    requirements = {
+        "kubernetes": K8S_TEMPLATE.substitute(
+            app=app,
+            replicas=replicas,
+            port=port,
+            memory=memory,
+            cpu=cpu,
+        ),
+        "terraform": TERRAFORM_TEMPLATE.substitute(
+            cloud=cloud,
+            cloud_upper=cloud.upper(),
+            service=service,
+            region=region,
+        ),
+        "docker": DOCKER_TEMPLATE.substitute(
+            app=app,
+            base_image_instruction=f"Using base image: {base_image}" if base_image else "",
+            port=port,
+        ),
+        "cicd": CICD_TEMPLATE.substitute(
+            platform=platform,
+            platform_upper=platform.upper(),
+            deploy_target=deploy_target,
+        ),
+    }
+
+    try:
+        import asyncio
+        from generators.orchestrator import generate_all as run_generators
+        from generators.k8s_generator import K8sGenerator
+        from generators.terraform_generator import TerraformGenerator
+        from generators.docker_generator import DockerGenerator
+        from generators.cicd_generator import CICDGenerator
+        from generators.documentation_generator import DocumentationGenerator
+
+        # Run all four generators concurrently
+        results = asyncio.run(run_generators(
+            k8s_requirements=requirements["kubernetes"],
+            terraform_requirements=requirements["terraform"],
+            docker_requirements=requirements["docker"],
+            cicd_requirements=requirements["cicd"],
+            platform=platform,
+        ))
+
+        # Save each type to its own subdirectory
+        dirs = {infra_type: os.path.join(output, infra_type) for infra_type in results}
+
+        K8sGenerator().save_outputs(results["kubernetes"], dirs["kubernetes"])
+        TerraformGenerator().save_outputs(results["terraform"], dirs["terraform"])
+        DockerGenerator().save_output(results["docker"], dirs["docker"])
+        CICDGenerator().save_output(results["cicd"], dirs["cicd"], platform)
+
+        generated_files = {
+            "kubernetes": list(results["kubernetes"]),
+            "terraform": list(results["terraform"]),
+            "docker": ["Dockerfile"],
+            "cicd": [f"{platform}-pipeline"],
+        }
+
+        doc_gen = DocumentationGenerator()
+        for infra_type, filenames in generated_files.items():
+            sections = doc_gen.guide_sections(infra_type, requirements[infra_type])
+            doc_gen.save_guide(doc_gen.assemble_guide(sections, filenames), dirs[infra_type])
+
+        click.echo("\n".join([
+            "\n" + "=" * 60,
+            "✅ SUCCESS! Infrastructure code generated",
+            "=" * 60,
+            f"\n📁 Output directory: {output}",
+            "\nGenerated directories:",
+            *(f"  - {infra_type}/" for infra_type in dirs),
+            "\n💡 Next steps:",
+            "  1. Review the generated files",
+            "  2. Check each IMPLEMENTATION_GUIDE.md for detailed instructions",
+        ]))
+
+    except Exception as e:
+        click.echo(f"\n❌ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+cmd = generate_all
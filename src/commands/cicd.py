@@ -0,0 +1,71 @@
+"""CI/CD pipeline generation command"""
+
+import click
+from src import config
+from src.commands import stream_echo
+from src.prompts import CICD_TEMPLATE
+
+
+@click.command(name="generate-cicd")
+@click.option('--platform', type=click.Choice(['github', 'gitlab']), default='github', help='CI/CD platform')
+@click.option('--deploy-target', default='kubernetes', help='Deployment target (kubernetes, aws, docker)')
+@click.option('--output', default=lambda: config.OUTPUT_DIR, help='Output directory')
+@click.pass_context
+def generate_cicd(ctx, platform, deploy_target, output):
+    """
+    Generate CI/CD pipeline configuration
+    
+    Example:
+        infraagent generate-cicd --platform github --deploy-target kubernetes
+    """
+    click.echo("\n".join([
+        "=" * 60,
+        f"🚀 InfraAgent - {platform.upper()} CI/CD Generator",
+        "=" * 60,
+    ]))
+    
+    requirements = CICD_TEMPLATE.substitute(
+        platform=platform,
+        platform_upper=platform.upper(),
+        deploy_target=deploy_target,
+    )
+    
+    try:
+        from generators.cicd_generator import CICDGenerator
+        from generators.documentation_generator import DocumentationGenerator
+        
+        # Render the guide sections that only need the requirements up front
+        doc_gen = DocumentationGenerator()
+        guide_sections = doc_gen.guide_sections("cicd", requirements)
+        
+        # Generate CI/CD pipeline
+        generator = CICDGenerator()
+        pipeline = generator.generate(requirements, platform, stream_echo(ctx))
+        
+        # Save output
+        generator.save_output(pipeline, output, platform)
+        
+        # Merge the generated file list into the implementation guide
+        guide = doc_gen.assemble_guide(guide_sections, [f"{platform}-pipeline"])
+        doc_gen.save_guide(guide, output)
+        
+        click.echo("\n".join([
+            "\n" + "=" * 60,
+            "✅ SUCCESS! CI/CD pipeline generated",
+            "=" * 60,
+            f"\n📁 Output directory: {output}",
+            "\nGenerated files:",
+            "  - .github/workflows/deploy.yml" if platform == "github" else "  - .gitlab-ci.yml",
+            "  - IMPLEMENTATION_GUIDE.md",
+            "\n💡 Next steps:",
+            "  1. Review the generated pipeline",
+            "  2. Configure required secrets in your repository",
+            "  3. Commit and push to trigger the pipeline",
+        ]))
+        
+    except Exception as e:
+        click.echo(f"\n❌ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+cmd = generate_cicd
@@ -0,0 +1,75 @@
+"""Dockerfile generation command"""
+
+import click
+from src import config
+from src.commands import APP_TYPES, stream_echo
+from src.prompts import DOCKER_TEMPLATE
+
+
+@click.command(name="generate-docker")
+@click.option('--app', required=True, type=click.Choice(APP_TYPES, case_sensitive=False), help='Application type')
+@click.option('--base-image', default=None, help='Base image (e.g., python:3.11-slim)')
+@click.option('--port', default=8080, help='Exposed port')
+@click.option('--output', default=lambda: config.OUTPUT_DIR, help='Output directory')
+@click.pass_context
+def generate_docker(ctx, app, base_image, port, output):
+    """
+    Generate optimized Dockerfile with multi-stage builds
+    
+    Example:
+        infraagent generate-docker --app python --port 8080
+    """
+    click.echo("\n".join([
+        "=" * 60,
+        "🚀 InfraAgent - Dockerfile Generator",
+        "=" * 60,
+    ]))
+    
+    base_image_instruction = f"Using base image: {base_image}" if base_image else ""
+    
+    requirements = DOCKER_TEMPLATE.substitute(
+        app=app,
+        base_image_instruction=base_image_instruction,
+        port=port,
+    )
+    
+    try:
+        from generators.docker_generator import DockerGenerator
+        from generators.documentation_generator import DocumentationGenerator
+        
+        # Render the guide sections that only need the requirements up front
+        doc_gen = DocumentationGenerator()
+        guide_sections = doc_gen.guide_sections("docker", requirements)
+        
+        # Generate Dockerfile
+        generator = DockerGenerator()
+        dockerfile = generator.generate(requirements, stream_echo(ctx))
+        
+        # Save output
+        generator.save_output(dockerfile, output)
+        
+        # Merge the generated file list into the implementation guide
+        guide = doc_gen.assemble_guide(guide_sections, ["Dockerfile"])
+        doc_gen.save_guide(guide, output)
+        
+        click.echo("\n".join([
+            "\n" + "=" * 60,
+            "✅ SUCCESS! Dockerfile generated",
+            "=" * 60,
+            f"\n📁 Output directory: {output}",
+            "\nGenerated files:",
+            "  - Dockerfile",
+            "  - .dockerignore",
+            "  - IMPLEMENTATION_GUIDE.md",
+            "\n💡 Next steps:",
+            "  1. Review the generated Dockerfile",
+            f"  2. docker build -t my-app:latest {output}",
+            "  3. docker run -p 8080:8080 my-app:latest",
+        ]))
+        
+    except Exception as e:
+        click.echo(f"\n❌ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+cmd = generate_docker
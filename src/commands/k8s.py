@@ -0,0 +1,73 @@
+"""Kubernetes manifest generation command"""
+
+import click
+from src import config
+from src.commands import APP_TYPES, stream_echo
+from src.prompts import K8S_TEMPLATE
+
+
+@click.command(name="generate-k8s")
+@click.option('--app', required=True, type=click.Choice(APP_TYPES, case_sensitive=False), help='Application type')
+@click.option('--replicas', default=3, help='Number of replicas')
+@click.option('--port', default=8080, help='Container port')
+@click.option('--memory', default='512Mi', help='Memory limit')
+@click.option('--cpu', default='250m', help='CPU limit')
+@click.option('--output', default=lambda: config.OUTPUT_DIR, help='Output directory')
+@click.pass_context
+def generate_k8s(ctx, app, replicas, port, memory, cpu, output):
+    """
+    Generate Kubernetes manifests (Deployment, Service, ConfigMap)
+    
+    Example:
+        infraagent generate-k8s --app flask --replicas 3 --port 8080
+    """
+    click.echo("\n".join([
+        "=" * 60,
+        "🚀 InfraAgent - Kubernetes Generator",
+        "=" * 60,
+    ]))
+    
+    requirements = K8S_TEMPLATE.substitute(
+        app=app,
+        replicas=replicas,
+        port=port,
+        memory=memory,
+        cpu=cpu,
+    )
+    
+    try:
+        from generators.k8s_generator import K8sGenerator
+        from generators.documentation_generator import DocumentationGenerator
+        
+        # Render the guide sections that only need the requirements up front
+        doc_gen = DocumentationGenerator()
+        guide_sections = doc_gen.guide_sections("kubernetes", requirements)
+        
+        # Generate manifests, saving each file as soon as it has streamed in
+        generator = K8sGenerator()
+        manifests = generator.save_outputs(generator.generate_stream(requirements, stream_echo(ctx)), output)
+        
+        # Merge the generated file list into the implementation guide
+        guide = doc_gen.assemble_guide(guide_sections, manifests)
+        doc_gen.save_guide(guide, output)
+        
+        click.echo("\n".join([
+            "\n" + "=" * 60,
+            "✅ SUCCESS! Kubernetes manifests generated",
+            "=" * 60,
+            f"\n📁 Output directory: {output}",
+            "\nGenerated files:",
+            *(f"  - {filename}" for filename in manifests),
+            "  - IMPLEMENTATION_GUIDE.md",
+            "\n💡 Next steps:",
+            "  1. Review the generated files",
+            f"  2. kubectl apply -f {output}/",
+            "  3. Check IMPLEMENTATION_GUIDE.md for detailed instructions",
+        ]))
+        
+    except Exception as e:
+        click.echo(f"\n❌ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+cmd = generate_k8s
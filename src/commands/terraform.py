@@ -0,0 +1,75 @@
+"""Terraform code generation command"""
+
+import click
+from src import config
+from src.commands import stream_echo
+from src.prompts import TERRAFORM_TEMPLATE
+
+
+@click.command(name="generate-terraform")
+@click.option('--cloud', type=click.Choice(['aws', 'azure', 'gcp'], case_sensitive=False), default='aws', help='Cloud provider')
+@click.option('--service', default='vpc', help='Service to deploy (vpc, rds, eks, etc.)')
+@click.option('--region', default='us-east-1', help='Cloud region')
+@click.option('--output', default=lambda: config.OUTPUT_DIR, help='Output directory')
+@click.pass_context
+def generate_terraform(ctx, cloud, service, region, output):
+    """
+    Generate Terraform infrastructure code
+    
+    Example:
+        infraagent generate-terraform --cloud aws --service vpc
+    """
+    click.echo("\n".join([
+        "=" * 60,
+        "🚀 InfraAgent - Terraform Generator",
+        "=" * 60,
+    ]))
+    
+    requirements = TERRAFORM_TEMPLATE.substitute(
+        cloud=cloud,
+        cloud_upper=cloud.upper(),
+        service=service,
+        region=region,
+    )
+    
+    try:
+        from generators.terraform_generator import TerraformGenerator
+        from generators.documentation_generator import DocumentationGenerator
+        
+        # Render the guide sections that only need the requirements up front
+        doc_gen = DocumentationGenerator()
+        guide_sections = doc_gen.guide_sections("terraform", requirements)
+        
+        # Generate Terraform code
+        generator = TerraformGenerator()
+        tf_files = generator.generate(requirements, stream_echo(ctx))
+        
+        # Save outputs
+        generator.save_outputs(tf_files, output)
+        
+        # Merge the generated file list into the implementation guide
+        guide = doc_gen.assemble_guide(guide_sections, tf_files)
+        doc_gen.save_guide(guide, output)
+        
+        click.echo("\n".join([
+            "\n" + "=" * 60,
+            "✅ SUCCESS! Terraform code generated",
+            "=" * 60,
+            f"\n📁 Output directory: {output}",
+            "\nGenerated files:",
+            *(f"  - {filename}" for filename in tf_files),
+            "  - IMPLEMENTATION_GUIDE.md",
+            "\n💡 Next steps:",
+            "  1. Review the generated files",
+            f"  2. cd {output}",
+            "  3. terraform init",
+            "  4. terraform plan",
+            "  5. terraform apply",
+        ]))
+        
+    except Exception as e:
+        click.echo(f"\n❌ Error: {str(e)}", err=True)
+        raise click.Abort()
+
+
+cmd = generate_terraform
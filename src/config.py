@@ -1,20 +1,53 @@
-"""Configuration management for InfraAgent"""
+"""Configuration management for InfraAgent
 
+Settings are read on first access (e.g. ``from src.config import OUTPUT_DIR``)
+rather than at import time, so importing this module doesn't touch the
+environment or look for a .env file.
+"""
+
+import functools
 import os
-from dotenv import load_dotenv
+from typing import Any, Dict
 
-# Load environment variables
-load_dotenv()
 
-# AI Model Configuration - Using Gemini 2.5 Flash
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-GEMINI_MAX_TOKENS = int(os.getenv("GEMINI_MAX_TOKENS", "8192"))
+@functools.lru_cache(maxsize=1)
+def _load() -> Dict[str, Any]:
+    """Load environment variables (including .env) and build the settings"""
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
+    settings = {
+        # AI Model Configuration - Using Gemini 2.5 Flash
+        "GEMINI_API_KEY": os.getenv("GEMINI_API_KEY", ""),
+        "GEMINI_MODEL": os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
+        "GEMINI_MAX_TOKENS": int(os.getenv("GEMINI_MAX_TOKENS", "8192")),
+        "GEMINI_CACHE_TTL": int(os.getenv("GEMINI_CACHE_TTL", "300")),
+        
+        # Output Configuration
+        "OUTPUT_DIR": os.getenv("OUTPUT_DIR", "/app/output"),
+        "DEFAULT_NAMESPACE": os.getenv("DEFAULT_NAMESPACE", "default"),
+        
+        # Response Cache Configuration
+        "CACHE_ENABLED": os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+        "CACHE_DIR": os.path.expanduser(os.getenv("CACHE_DIR", "~/.cache/infraagent")),
+        "CACHE_TTL": int(os.getenv("CACHE_TTL", str(7 * 24 * 60 * 60))),
+        
+        # Semantic Cache - reuse responses for reworded requirements (0 disables, 0.92 recommended)
+        "SEMANTIC_CACHE_THRESHOLD": float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0")),
+        "GEMINI_EMBEDDING_MODEL": os.getenv("GEMINI_EMBEDDING_MODEL", "models/text-embedding-004"),
+    }
+    
+    # Validation
+    if not settings["GEMINI_API_KEY"]:
+        print("⚠️  WARNING: GEMINI_API_KEY not set. Please set it in .env file or environment.")
+    
+    return settings
 
-# Output Configuration
-OUTPUT_DIR = os.getenv("OUTPUT_DIR", "/app/output")
-DEFAULT_NAMESPACE = os.getenv("DEFAULT_NAMESPACE", "default")
 
-# Validation
-if not GEMINI_API_KEY:
-    print("⚠️  WARNING: GEMINI_API_KEY not set. Please set it in .env file or environment.")
+def __getattr__(name: str) -> Any:
+    settings = _load()
+    if name in settings:
+        return settings[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,67 +1,102 @@
 """Documentation linking system for infrastructure code"""
 
+import functools
+import sys
+
+# Common URL prefixes shared by the links below
+_K8S_DOCS = "https://kubernetes.io/docs/"
+_TF_AWS_DOCS = "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/"
+_TF_LANG_DOCS = "https://developer.hashicorp.com/terraform/language/"
+_DOCKERFILE_DOCS = "https://docs.docker.com/engine/reference/builder/"
+_DOCKER_DOCS = "https://docs.docker.com/develop/"
+_GITHUB_DOCS = "https://docs.github.com/en/actions"
+_GITLAB_DOCS = "https://docs.gitlab.com/ee/ci/"
+
+
+def _interned(links: dict) -> dict:
+    """Intern the field names so lookups with interned strings compare by identity"""
+    return {sys.intern(field): link for field, link in links.items()}
+
+
 # Kubernetes Official Documentation Links
-K8S_DOC_LINKS = {
-    "apiVersion": "https://kubernetes.io/docs/reference/kubernetes-api/",
-    "Deployment": "https://kubernetes.io/docs/concepts/workloads/controllers/deployment/",
-    "spec.replicas": "https://kubernetes.io/docs/concepts/workloads/controllers/deployment/#replicas",
-    "spec.strategy": "https://kubernetes.io/docs/concepts/workloads/controllers/deployment/#strategy",
-    "containers": "https://kubernetes.io/docs/concepts/containers/",
-    "image": "https://kubernetes.io/docs/concepts/containers/images/",
-    "livenessProbe": "https://kubernetes.io/docs/tasks/configure-pod-container/configure-liveness-readiness-startup-probes/",
-    "readinessProbe": "https://kubernetes.io/docs/tasks/configure-pod-container/configure-liveness-readiness-startup-probes/#define-readiness-probes",
-    "resources": "https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/",
-    "resources.requests": "https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#resource-requests-and-limits-of-pod-and-container",
-    "resources.limits": "https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#resource-requests-and-limits-of-pod-and-container",
-    "securityContext": "https://kubernetes.io/docs/tasks/configure-pod-container/security-context/",
-    "runAsNonRoot": "https://kubernetes.io/docs/tasks/configure-pod-container/security-context/#set-the-security-context-for-a-pod",
-    "Service": "https://kubernetes.io/docs/concepts/services-networking/service/",
-    "Service.type": "https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types",
-    "ConfigMap": "https://kubernetes.io/docs/concepts/configuration/configmap/",
-    "namespace": "https://kubernetes.io/docs/concepts/overview/working-with-objects/namespaces/",
-    "labels": "https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/",
-    "selector": "https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors",
-}
+K8S_DOC_LINKS = _interned({
+    "apiVersion": _K8S_DOCS + "reference/kubernetes-api/",
+    "Deployment": _K8S_DOCS + "concepts/workloads/controllers/deployment/",
+    "spec.replicas": _K8S_DOCS + "concepts/workloads/controllers/deployment/#replicas",
+    "spec.strategy": _K8S_DOCS + "concepts/workloads/controllers/deployment/#strategy",
+    "containers": _K8S_DOCS + "concepts/containers/",
+    "image": _K8S_DOCS + "concepts/containers/images/",
+    "livenessProbe": _K8S_DOCS + "tasks/configure-pod-container/configure-liveness-readiness-startup-probes/",
+    "readinessProbe": _K8S_DOCS + "tasks/configure-pod-container/configure-liveness-readiness-startup-probes/#define-readiness-probes",
+    "resources": _K8S_DOCS + "concepts/configuration/manage-resources-containers/",
+    "resources.requests": _K8S_DOCS + "concepts/configuration/manage-resources-containers/#resource-requests-and-limits-of-pod-and-container",
+    "resources.limits": _K8S_DOCS + "concepts/configuration/manage-resources-containers/#resource-requests-and-limits-of-pod-and-container",
+    "securityContext": _K8S_DOCS + "tasks/configure-pod-container/security-context/",
+    "runAsNonRoot": _K8S_DOCS + "tasks/configure-pod-container/security-context/#set-the-security-context-for-a-pod",
+    "Service": _K8S_DOCS + "concepts/services-networking/service/",
+    "Service.type": _K8S_DOCS + "concepts/services-networking/service/#publishing-services-service-types",
+    "ConfigMap": _K8S_DOCS + "concepts/configuration/configmap/",
+    "namespace": _K8S_DOCS + "concepts/overview/working-with-objects/namespaces/",
+    "labels": _K8S_DOCS + "concepts/overview/working-with-objects/labels/",
+    "selector": _K8S_DOCS + "concepts/overview/working-with-objects/labels/#label-selectors",
+})
 
 # Terraform Official Documentation Links
-TERRAFORM_DOC_LINKS = {
-    "aws_vpc": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/vpc",
-    "aws_subnet": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/subnet",
-    "aws_internet_gateway": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/internet_gateway",
-    "aws_route_table": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/route_table",
-    "aws_security_group": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/security_group",
-    "aws_db_instance": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/db_instance",
-    "aws_rds_cluster": "https://registry.terraform.io/providers/hashicorp/aws/latest/docs/resources/rds_cluster",
-    "variable": "https://developer.hashicorp.com/terraform/language/values/variables",
-    "output": "https://developer.hashicorp.com/terraform/language/values/outputs",
-    "provider": "https://developer.hashicorp.com/terraform/language/providers",
-}
+TERRAFORM_DOC_LINKS = _interned({
+    "aws_vpc": _TF_AWS_DOCS + "vpc",
+    "aws_subnet": _TF_AWS_DOCS + "subnet",
+    "aws_internet_gateway": _TF_AWS_DOCS + "internet_gateway",
+    "aws_route_table": _TF_AWS_DOCS + "route_table",
+    "aws_security_group": _TF_AWS_DOCS + "security_group",
+    "aws_db_instance": _TF_AWS_DOCS + "db_instance",
+    "aws_rds_cluster": _TF_AWS_DOCS + "rds_cluster",
+    "variable": _TF_LANG_DOCS + "values/variables",
+    "output": _TF_LANG_DOCS + "values/outputs",
+    "provider": _TF_LANG_DOCS + "providers",
+})
 
 # Docker Official Documentation Links
-DOCKER_DOC_LINKS = {
-    "FROM": "https://docs.docker.com/engine/reference/builder/#from",
-    "RUN": "https://docs.docker.com/engine/reference/builder/#run",
-    "COPY": "https://docs.docker.com/engine/reference/builder/#copy",
-    "ADD": "https://docs.docker.com/engine/reference/builder/#add",
-    "WORKDIR": "https://docs.docker.com/engine/reference/builder/#workdir",
-    "ENV": "https://docs.docker.com/engine/reference/builder/#env",
-    "EXPOSE": "https://docs.docker.com/engine/reference/builder/#expose",
-    "ENTRYPOINT": "https://docs.docker.com/engine/reference/builder/#entrypoint",
-    "CMD": "https://docs.docker.com/engine/reference/builder/#cmd",
-    "USER": "https://docs.docker.com/engine/reference/builder/#user",
-    "HEALTHCHECK": "https://docs.docker.com/engine/reference/builder/#healthcheck",
-    "multi-stage": "https://docs.docker.com/develop/develop-images/multistage-build/",
-    "best-practices": "https://docs.docker.com/develop/dev-best-practices/dockerfile-best-practices/",
-}
+DOCKER_DOC_LINKS = _interned({
+    "FROM": _DOCKERFILE_DOCS + "#from",
+    "RUN": _DOCKERFILE_DOCS + "#run",
+    "COPY": _DOCKERFILE_DOCS + "#copy",
+    "ADD": _DOCKERFILE_DOCS + "#add",
+    "WORKDIR": _DOCKERFILE_DOCS + "#workdir",
+    "ENV": _DOCKERFILE_DOCS + "#env",
+    "EXPOSE": _DOCKERFILE_DOCS + "#expose",
+    "ENTRYPOINT": _DOCKERFILE_DOCS + "#entrypoint",
+    "CMD": _DOCKERFILE_DOCS + "#cmd",
+    "USER": _DOCKERFILE_DOCS + "#user",
+    "HEALTHCHECK": _DOCKERFILE_DOCS + "#healthcheck",
+    "multi-stage": _DOCKER_DOCS + "develop-images/multistage-build/",
+    "best-practices": _DOCKER_DOCS + "dev-best-practices/dockerfile-best-practices/",
+})
 
 # CI/CD Documentation Links
-CICD_DOC_LINKS = {
-    "github-actions": "https://docs.github.com/en/actions",
-    "workflow-syntax": "https://docs.github.com/en/actions/using-workflows/workflow-syntax-for-github-actions",
-    "gitlab-ci": "https://docs.gitlab.com/ee/ci/",
-    "gitlab-ci-yaml": "https://docs.gitlab.com/ee/ci/yaml/",
+CICD_DOC_LINKS = _interned({
+    "github-actions": _GITHUB_DOCS,
+    "workflow-syntax": _GITHUB_DOCS + "/using-workflows/workflow-syntax-for-github-actions",
+    "gitlab-ci": _GITLAB_DOCS,
+    "gitlab-ci-yaml": _GITLAB_DOCS + "yaml/",
+})
+
+
+_DOC_LINK_MAPS = {
+    "kubernetes": K8S_DOC_LINKS,
+    "terraform": TERRAFORM_DOC_LINKS,
+    "docker": DOCKER_DOC_LINKS,
+    "cicd": CICD_DOC_LINKS,
 }
 
+# Every (infra_type, field) pair in one dict, so a lookup is a single hash
+_MERGED_DOC_LINKS = {
+    (infra_type, field): link
+    for infra_type, links in _DOC_LINK_MAPS.items()
+    for field, link in links.items()
+}
+
+_DEFAULT_DOC_LINK = _K8S_DOCS
+
 
 def get_doc_link(field: str, infra_type: str = "kubernetes") -> str:
     """
@@ -74,17 +109,18 @@ def get_doc_link(field: str, infra_type: str = "kubernetes") -> str:
     Returns:
         str: URL to official documentation
     """
-    link_maps = {
-        "kubernetes": K8S_DOC_LINKS,
-        "terraform": TERRAFORM_DOC_LINKS,
-        "docker": DOCKER_DOC_LINKS,
-        "cicd": CICD_DOC_LINKS,
-    }
+    link = _MERGED_DOC_LINKS.get((infra_type, field))
+    if link is not None:
+        return link
+    
+    # Unknown infrastructure types use the Kubernetes links
+    if infra_type not in _DOC_LINK_MAPS:
+        return K8S_DOC_LINKS.get(field, _DEFAULT_DOC_LINK)
     
-    links = link_maps.get(infra_type, K8S_DOC_LINKS)
-    return links.get(field, f"https://kubernetes.io/docs/")
+    return _DEFAULT_DOC_LINK
 
 
+@functools.lru_cache(maxsize=None)
 def format_doc_comment(field: str, infra_type: str = "kubernetes") -> str:
     """
     Format a documentation comment for a field
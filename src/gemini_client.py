@@ -1,42 +1,22 @@
 """AI client for infrastructure code generation using Gemini 3 Pro"""
 
-import google.generativeai as genai
-from typing import Optional
-from src.config import GEMINI_API_KEY, GEMINI_MODEL, GEMINI_MAX_TOKENS
+import datetime
+import hashlib
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from src.config import GEMINI_API_KEY, GEMINI_MODEL, GEMINI_MAX_TOKENS, GEMINI_EMBEDDING_MODEL, GEMINI_CACHE_TTL
+from src.llm_cache import cached_llm
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
-class GeminiClient:
-    """Client for interacting with Gemini AI"""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize AI client
-        
-        Args:
-            api_key: Optional API key (uses config if not provided)
-        """
-        self.api_key = api_key or GEMINI_API_KEY
-        
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY is required. Set it in .env file or pass it directly.")
-        
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(GEMINI_MODEL)
-    
-    def generate_kubernetes_yaml(self, requirements: str) -> str:
-        """
-        Generate Kubernetes YAML manifests
-        
-        Args:
-            requirements: Natural language requirements for the Kubernetes deployment
-        
-        Returns:
-            str: Generated YAML content
-        """
-        prompt = f"""You are an expert Kubernetes architect and DevOps engineer.
 
-Generate PRODUCTION-READY Kubernetes YAML manifests based on these requirements:
-{requirements}
+# Static prompt prefixes, used as the system instruction of one reused model
+# per generator type. Only the user's requirements are sent with each request,
+# after a byte-identical instruction that Gemini can serve from its cache.
+_SYSTEM_PREFIX_K8S = """You are an expert Kubernetes architect and DevOps engineer.
 
 CRITICAL INSTRUCTIONS:
 1. Generate COMPLETE, working YAML (not snippets or examples)
@@ -65,25 +45,11 @@ Separate each file with:
 # FILE: filename.yaml
 
 Include documentation comments above each major field explaining what it does and linking to official Kubernetes docs.
+
+Generate PRODUCTION-READY Kubernetes YAML manifests based on these requirements:
 """
-        
-        response = self.model.generate_content(prompt)
-        return response.text
-    
-    def generate_terraform_code(self, requirements: str) -> str:
-        """
-        Generate Terraform infrastructure code
-        
-        Args:
-            requirements: Natural language requirements for infrastructure
-        
-        Returns:
-            str: Generated Terraform code
-        """
-        prompt = f"""You are an expert Terraform architect specializing in AWS infrastructure.
 
-Generate PRODUCTION-READY Terraform code based on these requirements:
-{requirements}
+_SYSTEM_PREFIX_TF = """You are an expert Terraform architect specializing in AWS infrastructure.
 
 CRITICAL INSTRUCTIONS:
 1. Generate complete Terraform code (not snippets)
@@ -110,25 +76,11 @@ Separate each file with:
 # FILE: filename.tf
 
 Include documentation comments explaining each resource and linking to official Terraform documentation.
+
+Generate PRODUCTION-READY Terraform code based on these requirements:
 """
-        
-        response = self.model.generate_content(prompt)
-        return response.text
-    
-    def generate_dockerfile(self, requirements: str) -> str:
-        """
-        Generate optimized Dockerfile
-        
-        Args:
-            requirements: Natural language requirements for Docker image
-        
-        Returns:
-            str: Generated Dockerfile
-        """
-        prompt = f"""You are an expert Docker architect.
 
-Generate a PRODUCTION-READY, optimized Dockerfile based on these requirements:
-{requirements}
+_SYSTEM_PREFIX_DOCKER = """You are an expert Docker architect.
 
 CRITICAL INSTRUCTIONS:
 1. Use multi-stage builds for optimization
@@ -148,44 +100,16 @@ CRITICAL INSTRUCTIONS:
 9. Proper ENTRYPOINT and CMD usage
 
 Generate a complete Dockerfile with detailed comments explaining each instruction and linking to official Docker documentation.
+
+Generate a PRODUCTION-READY, optimized Dockerfile based on these requirements:
 """
-        
-        response = self.model.generate_content(prompt)
-        return response.text
-    
-    def generate_cicd_pipeline(self, requirements: str, platform: str = "github") -> str:
-        """
-        Generate CI/CD pipeline configuration
-        
-        Args:
-            requirements: Natural language requirements
-            platform: CI/CD platform (github, gitlab)
-        
-        Returns:
-            str: Generated pipeline configuration
-        """
-        platform_config = {
-            "github": {
-                "file": ".github/workflows/deploy.yml",
-                "docs": "https://docs.github.com/en/actions"
-            },
-            "gitlab": {
-                "file": ".gitlab-ci.yml",
-                "docs": "https://docs.gitlab.com/ee/ci/"
-            }
-        }
-        
-        config = platform_config.get(platform, platform_config["github"])
-        
-        prompt = f"""You are an expert DevOps engineer specializing in CI/CD pipelines.
 
-Generate a PRODUCTION-READY {platform.upper()} CI/CD pipeline based on these requirements:
-{requirements}
+_SYSTEM_PREFIX_CICD = """You are an expert DevOps engineer specializing in CI/CD pipelines.
 
 CRITICAL INSTRUCTIONS:
 1. Generate complete pipeline configuration (not snippets)
 2. Include inline comments with links to official {platform} docs
-3. Reference: {config['docs']}
+3. Reference: {docs}
 4. Implement best practices:
    - Proper job dependencies
    - Caching where applicable
@@ -199,32 +123,389 @@ CRITICAL INSTRUCTIONS:
 7. Add proper error handling
 
 Generate a complete pipeline configuration with detailed comments linking to official documentation.
+
+Generate a PRODUCTION-READY {platform_upper} CI/CD pipeline based on these requirements:
 """
+
+_PREFIXES = {
+    "kubernetes": _SYSTEM_PREFIX_K8S,
+    "terraform": _SYSTEM_PREFIX_TF,
+    "docker": _SYSTEM_PREFIX_DOCKER,
+}
+
+# Gemini rejects context caches below ~1024 tokens (roughly 4 characters per token)
+_MIN_CACHEABLE_PREFIX_CHARS = 4 * 1024
+
+# Share of GEMINI_CACHE_TTL after which a cache-backed model is rebuilt, so a
+# request never goes out against a context cache Gemini has already dropped
+_CACHE_REFRESH_FRACTION = 0.9
+
+_CICD_PLATFORMS = {
+    "github": {
+        "file": ".github/workflows/deploy.yml",
+        "docs": "https://docs.github.com/en/actions"
+    },
+    "gitlab": {
+        "file": ".gitlab-ci.yml",
+        "docs": "https://docs.gitlab.com/ee/ci/"
+    }
+}
+
+# CI/CD prefixes are formatted once per known platform so every request for a
+# platform reuses the same string (and hits the same prompt/response caches)
+_CICD_PREFIXES = {
+    platform: _SYSTEM_PREFIX_CICD.format(
+        platform=platform,
+        platform_upper=platform.upper(),
+        docs=config["docs"]
+    )
+    for platform, config in _CICD_PLATFORMS.items()
+}
+
+
+class GeminiClient:
+    """Client for interacting with Gemini AI"""
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize AI client
+        
+        Args:
+            api_key: Optional API key (uses config if not provided)
+        """
+        self.api_key = api_key or GEMINI_API_KEY
+        
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY is required. Set it in .env file or pass it directly.")
+        
+        # Imported here so importing this module (e.g. to mock the client)
+        # does not pay for the SDK and its protobuf/gRPC dependencies
+        import google.generativeai as genai
+        self._genai = genai
+        
+        genai.configure(api_key=self.api_key)
+        self.model = genai.GenerativeModel(GEMINI_MODEL)
+        
+        # One model per prompt prefix, with the prefix as its (possibly cached) system
+        # instruction, and the time.monotonic() value after which it must be rebuilt
+        self._prefix_models: Dict[str, Tuple["genai.GenerativeModel", float]] = {}
+    
+    def embed(self, text: str) -> List[float]:
+        """
+        Compute an embedding for semantic cache lookups
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            List[float]: Embedding vector
+        """
+        response = self._genai.embed_content(model=GEMINI_EMBEDDING_MODEL, content=text)
+        return response["embedding"]
+    
+    @cached_llm("kubernetes")
+    def generate_kubernetes_yaml(self, requirements: str) -> str:
+        """
+        Generate Kubernetes YAML manifests
         
-        response = self.model.generate_content(prompt)
+        Args:
+            requirements: Natural language requirements for the Kubernetes deployment
+        
+        Returns:
+            str: Generated YAML content
+        """
+        return self._generate(_SYSTEM_PREFIX_K8S, requirements)
+    
+    @cached_llm("kubernetes")
+    async def agenerate_kubernetes_yaml(self, requirements: str) -> str:
+        """Async variant of generate_kubernetes_yaml"""
+        return await self._agenerate(_SYSTEM_PREFIX_K8S, requirements)
+    
+    @cached_llm("kubernetes")
+    def generate_kubernetes_yaml_stream(self, requirements: str) -> Iterator[str]:
+        """
+        Stream Kubernetes YAML manifests as they are generated
+        
+        Args:
+            requirements: Natural language requirements for the Kubernetes deployment
+        
+        Yields:
+            str: Chunks of generated YAML content
+        """
+        yield from self._stream(_SYSTEM_PREFIX_K8S, requirements)
+    
+    @cached_llm("terraform")
+    def generate_terraform_code(self, requirements: str) -> str:
+        """
+        Generate Terraform infrastructure code
+        
+        Args:
+            requirements: Natural language requirements for infrastructure
+        
+        Returns:
+            str: Generated Terraform code
+        """
+        return self._generate(_SYSTEM_PREFIX_TF, requirements)
+    
+    @cached_llm("terraform")
+    async def agenerate_terraform_code(self, requirements: str) -> str:
+        """Async variant of generate_terraform_code"""
+        return await self._agenerate(_SYSTEM_PREFIX_TF, requirements)
+    
+    @cached_llm("terraform")
+    def generate_terraform_code_stream(self, requirements: str) -> Iterator[str]:
+        """
+        Stream Terraform code as it is generated
+        
+        Args:
+            requirements: Natural language requirements for infrastructure
+        
+        Yields:
+            str: Chunks of generated Terraform code
+        """
+        yield from self._stream(_SYSTEM_PREFIX_TF, requirements)
+    
+    @cached_llm("docker")
+    def generate_dockerfile(self, requirements: str) -> str:
+        """
+        Generate optimized Dockerfile
+        
+        Args:
+            requirements: Natural language requirements for Docker image
+        
+        Returns:
+            str: Generated Dockerfile
+        """
+        return self._generate(_SYSTEM_PREFIX_DOCKER, requirements)
+    
+    @cached_llm("docker")
+    async def agenerate_dockerfile(self, requirements: str) -> str:
+        """Async variant of generate_dockerfile"""
+        return await self._agenerate(_SYSTEM_PREFIX_DOCKER, requirements)
+    
+    @cached_llm("docker")
+    def generate_dockerfile_stream(self, requirements: str) -> Iterator[str]:
+        """
+        Stream a Dockerfile as it is generated
+        
+        Args:
+            requirements: Natural language requirements for Docker image
+        
+        Yields:
+            str: Chunks of the generated Dockerfile
+        """
+        yield from self._stream(_SYSTEM_PREFIX_DOCKER, requirements)
+    
+    @cached_llm("cicd")
+    def generate_cicd_pipeline(self, requirements: str, platform: str = "github") -> str:
+        """
+        Generate CI/CD pipeline configuration
+        
+        Args:
+            requirements: Natural language requirements
+            platform: CI/CD platform (github, gitlab)
+        
+        Returns:
+            str: Generated pipeline configuration
+        """
+        return self._generate(self._cicd_prefix(platform), requirements)
+    
+    @cached_llm("cicd")
+    async def agenerate_cicd_pipeline(self, requirements: str, platform: str = "github") -> str:
+        """Async variant of generate_cicd_pipeline"""
+        return await self._agenerate(self._cicd_prefix(platform), requirements)
+    
+    @cached_llm("cicd")
+    def generate_cicd_pipeline_stream(self, requirements: str, platform: str = "github") -> Iterator[str]:
+        """
+        Stream a CI/CD pipeline configuration as it is generated
+        
+        Args:
+            requirements: Natural language requirements
+            platform: CI/CD platform (github, gitlab)
+        
+        Yields:
+            str: Chunks of the generated pipeline configuration
+        """
+        yield from self._stream(self._cicd_prefix(platform), requirements)
+    
+    def prompt_prefix(self, method: str, platform: str = "") -> str:
+        """
+        Get the static prompt prefix for a generation type
+        
+        Args:
+            method: Generation type (kubernetes, terraform, docker, cicd)
+            platform: CI/CD platform, only used for cicd
+        
+        Returns:
+            str: Prompt text sent before the requirements
+        """
+        if method == "cicd":
+            return self._cicd_prefix(platform)
+        return _PREFIXES[method]
+    
+    def _cicd_prefix(self, platform: str) -> str:
+        """Get the static CI/CD prompt prefix for a platform"""
+        prefix = _CICD_PREFIXES.get(platform)
+        if prefix is not None:
+            return prefix
+        
+        # Unknown platforms get their own name with the GitHub docs link
+        config = _CICD_PLATFORMS["github"]
+        return _SYSTEM_PREFIX_CICD.format(
+            platform=platform,
+            platform_upper=platform.upper(),
+            docs=config["docs"]
+        )
+    
+    def _generate(self, prefix: str, requirements: str) -> str:
+        """Send a prefix + requirements request and return the response text"""
+        response = self._model_for(prefix).generate_content(requirements)
+        self._log_usage(response)
+        return response.text
+    
+    async def _agenerate(self, prefix: str, requirements: str) -> str:
+        """Async variant of _generate"""
+        response = await self._model_for(prefix).generate_content_async(requirements)
+        self._log_usage(response)
         return response.text
+    
+    def _stream(self, prefix: str, requirements: str) -> Iterator[str]:
+        """Send a prefix + requirements request and yield the response text as it arrives"""
+        response = self._model_for(prefix).generate_content(requirements, stream=True)
+        at_line_start = True
+        for chunk in response:
+            if chunk.parts and chunk.text:
+                at_line_start = chunk.text.endswith("\n")
+                yield chunk.text
+        
+        # Echoed output usually stops mid-line (after a closing fence), so end
+        # that line before anything else is printed
+        if not at_line_start:
+            print()
+        self._log_usage(response)
+    
+    def _model_for(self, prefix: str) -> "genai.GenerativeModel":
+        """
+        Get the model whose system instruction is a prompt prefix
+        
+        One model is built per prefix and reused for every request, so only
+        the requirements are sent as contents. The first call for each prefix
+        tries to store it in a Gemini context cache so it is only billed at
+        the cached rate. A live cache left by an earlier run with the same
+        model and prefix is reused (and its TTL refreshed) instead of creating
+        a new one. A cache-backed model is rebuilt shortly before the cache's
+        TTL runs out, which finds or re-creates the cache. When caching is
+        not possible (e.g. the prefix is below the model's minimum cacheable
+        size) the prefix is set as a plain system instruction instead.
+        
+        Args:
+            prefix: Static prompt prefix
+        
+        Returns:
+            GenerativeModel to send the requirements to
+        """
+        now = time.monotonic()
+        model, expires_at = self._prefix_models.get(prefix, (None, 0.0))
+        if model is not None and now < expires_at:
+            return model
+        
+        model = None
+        if len(prefix) >= _MIN_CACHEABLE_PREFIX_CHARS:
+            try:
+                model = self._genai.GenerativeModel.from_cached_content(self._context_cache(prefix))
+                expires_at = now + GEMINI_CACHE_TTL * _CACHE_REFRESH_FRACTION
+            except Exception:
+                model = None
+        
+        if model is None:
+            model = self._genai.GenerativeModel(GEMINI_MODEL, system_instruction=prefix)
+            expires_at = math.inf
+        
+        self._prefix_models[prefix] = (model, expires_at)
+        return model
+    
+    def _context_cache(self, prefix: str) -> "genai.caching.CachedContent":
+        """
+        Find or create the Gemini context cache holding a prompt prefix
+        
+        Args:
+            prefix: Static prompt prefix
+        
+        Returns:
+            CachedContent whose system instruction is the prefix
+        """
+        ttl = datetime.timedelta(seconds=GEMINI_CACHE_TTL)
+        digest = hashlib.sha256(f"{GEMINI_MODEL}\0{prefix}".encode("utf-8")).hexdigest()
+        display_name = f"infraagent-{digest[:32]}"
+        
+        for cache in self._genai.caching.CachedContent.list():
+            if cache.display_name == display_name:
+                cache.update(ttl=ttl)
+                return cache
+        
+        return self._genai.caching.CachedContent.create(
+            model=GEMINI_MODEL,
+            display_name=display_name,
+            system_instruction=prefix,
+            ttl=ttl,
+        )
+    
+    def _log_usage(self, response):
+        """Print token usage, including tokens served from the prompt cache"""
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return
+        
+        print(
+            f"📊 Tokens: {usage.prompt_token_count} prompt "
+            f"({usage.cached_content_token_count} cached), "
+            f"{usage.candidates_token_count} output"
+        )
+
+
+_client: Optional[GeminiClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> GeminiClient:
+    """
+    Get the shared GeminiClient
+    
+    Generators and the convenience functions below share one client so the
+    SDK is configured, and its connection set up, once per process instead of
+    once per call. Creation is locked so concurrent first calls from
+    different threads cannot build two clients.
+    
+    Returns:
+        GeminiClient: Process-wide client instance
+    """
+    global _client
+    
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = GeminiClient()
+    
+    return _client
 
 
 # Convenience functions
 def generate_k8s_yaml(requirements: str) -> str:
     """Generate Kubernetes YAML (convenience function)"""
-    client = GeminiClient()
-    return client.generate_kubernetes_yaml(requirements)
+    return get_client().generate_kubernetes_yaml(requirements)
 
 
 def generate_terraform(requirements: str) -> str:
     """Generate Terraform code (convenience function)"""
-    client = GeminiClient()
-    return client.generate_terraform_code(requirements)
+    return get_client().generate_terraform_code(requirements)
 
 
 def generate_dockerfile(requirements: str) -> str:
     """Generate Dockerfile (convenience function)"""
-    client = GeminiClient()
-    return client.generate_dockerfile(requirements)
+    return get_client().generate_dockerfile(requirements)
 
 
 def generate_cicd(requirements: str, platform: str = "github") -> str:
     """Generate CI/CD pipeline (convenience function)"""
-    client = GeminiClient()
-    return client.generate_cicd_pipeline(requirements, platform)
+    return get_client().generate_cicd_pipeline(requirements, platform)
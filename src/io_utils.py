@@ -0,0 +1,34 @@
+"""File output helpers shared by the generators"""
+
+import os
+import sys
+from typing import List
+
+
+def write_file(path: str, data: bytes):
+    """
+    Write pre-encoded bytes to a file with a single open/write/close
+
+    Args:
+        path: Destination file path (created or truncated)
+        data: Encoded file content
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def print_lines(lines: List[str]):
+    """
+    Print several log lines with a single write to stdout
+
+    Args:
+        lines: Lines to print
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
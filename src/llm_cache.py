@@ -0,0 +1,416 @@
+"""Persistent response cache for Gemini calls"""
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import inspect
+import math
+import os
+import re
+import sqlite3
+import time
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from src.config import CACHE_DIR, CACHE_ENABLED, CACHE_TTL, GEMINI_MODEL, SEMANTIC_CACHE_THRESHOLD
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(record: dict) -> bytes:
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Set by bypass_cache(): skip lookups but keep storing fresh responses
+_bypass = False
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize requirements so whitespace-only differences share a cache entry
+
+    Case and punctuation are kept: "512M" and "512m" or "0.5" and "0-5"
+    ask for different resources.
+
+    Args:
+        text: Natural language requirements
+
+    Returns:
+        str: Text with whitespace runs collapsed to single spaces
+    """
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def make_key(prompt_prefix: str, requirements: str, model: str = GEMINI_MODEL) -> str:
+    """
+    Build the content-addressed cache key for a generation request
+
+    The key covers the model and the full prompt (static prefix plus
+    requirements with whitespace collapsed), so changing either one never
+    serves a stale response.
+
+    Args:
+        prompt_prefix: Static prompt prefix sent before the requirements
+        requirements: Natural language requirements
+        model: Gemini model name
+
+    Returns:
+        str: SHA-256 hex digest identifying the request
+    """
+    raw = f"{model}\0{prompt_prefix}{normalize(requirements)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def make_scope(prompt_prefix: str, model: str = GEMINI_MODEL) -> str:
+    """
+    Identify the model and prompt prefix a response was generated with
+
+    Semantic matches are only looked up within one scope, so switching the
+    model or changing a prompt never serves responses made for the old one.
+
+    Args:
+        prompt_prefix: Static prompt prefix sent before the requirements
+        model: Gemini model name
+
+    Returns:
+        str: SHA-256 hex digest of the model and prefix
+    """
+    return hashlib.sha256(f"{model}\0{prompt_prefix}".encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """SQLite-backed key/value store with per-entry expiry"""
+
+    def __init__(self, path: str, ttl: int = CACHE_TTL):
+        """
+        Open (and create if needed) the cache database
+
+        Args:
+            path: Path to the SQLite file
+            ttl: Seconds an entry stays valid
+        """
+        self.path = path
+        self.ttl = ttl
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB, ts INTEGER)"
+            )
+            # Embeddings stored before they carried a scope cannot be matched safely
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(embeddings)")]
+            if columns and "scope" not in columns:
+                conn.execute("DROP TABLE embeddings")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, method TEXT, platform TEXT, scope TEXT, vector BLOB, ts INTEGER)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open a short-lived connection so the cache is safe to share across threads"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached text, or None on a miss or expired entry
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, ts FROM responses WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            value, ts = row
+            if ts + self.ttl < time.time():
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            try:
+                return _loads(value)["text"]
+            except (ValueError, TypeError, KeyError):
+                # Unreadable (e.g. written by an older version): treat as a miss
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+    def set(self, key: str, value: str):
+        """
+        Store a response
+
+        Args:
+            key: Cache key
+            value: Response text
+        """
+        now = time.time()
+        record = _dumps({"text": value, "model": GEMINI_MODEL, "ts": now})
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, ts) VALUES (?, ?, ?)",
+                (key, record, int(now)),
+            )
+
+    def add_embedding(self, key: str, method: str, platform: str, scope: str, vector: List[float]):
+        """
+        Store the requirements embedding for a cached response
+
+        Args:
+            key: Cache key of the response
+            method: Generation type
+            platform: Target platform, empty when not applicable
+            scope: Model and prompt prefix digest (see make_scope)
+            vector: Embedding of the requirements
+        """
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        blob = array("f", (x / norm for x in vector)).tobytes()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, method, platform, scope, vector, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, method, platform, scope, blob, int(time.time())),
+            )
+
+    def nearest(self, method: str, platform: str, scope: str, vector: List[float]) -> Optional[Tuple[float, str]]:
+        """
+        Find the most similar stored requirements for the same method, platform and scope
+
+        Args:
+            method: Generation type
+            platform: Target platform, empty when not applicable
+            scope: Model and prompt prefix digest (see make_scope)
+            vector: Embedding of the new requirements
+
+        Returns:
+            (cosine similarity, cache key) of the best match, or None if nothing is stored
+        """
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        query = [x / norm for x in vector]
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, vector FROM embeddings WHERE method = ? AND platform = ? AND scope = ? AND ts >= ?",
+                (method, platform, scope, int(time.time()) - self.ttl),
+            ).fetchall()
+
+        best = None
+        for key, blob in rows:
+            score = sum(a * b for a, b in zip(query, array("f", blob)))
+            if best is None or score > best[0]:
+                best = (score, key)
+
+        return best
+
+
+def bypass_cache():
+    """Ignore cached responses for the rest of the process (--no-cache); fresh ones are still stored"""
+    global _bypass
+    _bypass = True
+
+
+def get_cache() -> Optional[DiskCache]:
+    """
+    Get the process-wide response cache
+
+    Returns:
+        DiskCache, or None when caching is disabled or the cache directory is unusable
+    """
+    if not CACHE_ENABLED:
+        return None
+
+    return _open_cache()
+
+
+@functools.lru_cache(maxsize=1)
+def _open_cache() -> Optional[DiskCache]:
+    """Open the cache database once per process"""
+    try:
+        return DiskCache(os.path.join(CACHE_DIR, "responses.sqlite3"))
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  WARNING: Response cache disabled ({e})")
+        return None
+
+
+def _semantic_lookup(cache: DiskCache, client, method: str, platform: str, scope: str,
+                     requirements: str) -> Tuple[Optional[List[float]], Optional[str]]:
+    """
+    Embed the requirements and look for a cached response to similar ones
+
+    Args:
+        cache: Response cache
+        client: GeminiClient used to compute the embedding
+        method: Generation type
+        platform: Target platform, empty when not applicable
+        scope: Model and prompt prefix digest (see make_scope)
+        requirements: Natural language requirements
+
+    Returns:
+        (embedding, cached response); either may be None
+    """
+    try:
+        vector = client.embed(requirements)
+    except Exception as e:
+        print(f"⚠️  WARNING: Semantic cache lookup skipped ({e})")
+        return None, None
+
+    if _bypass:
+        return vector, None
+
+    try:
+        match = cache.nearest(method, platform, scope, vector)
+        if match is None or match[0] < SEMANTIC_CACHE_THRESHOLD:
+            return vector, None
+
+        return vector, cache.get(match[1])
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  WARNING: Semantic cache lookup failed ({e})")
+        return vector, None
+
+
+def cached_llm(method: str) -> Callable:
+    """
+    Decorator caching a GeminiClient.generate_* method on its requirements
+
+    Works for regular, async and streaming (generator) methods.
+
+    Args:
+        method: Generation type used as part of the cache key
+
+    Returns:
+        Callable: Decorator for the client method
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def lookup(args, kwargs) -> Tuple[str, Tuple[str, str], Optional[str]]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            platform = bound.arguments.get("platform", "")
+            prefix = bound.arguments["self"].prompt_prefix(method, platform)
+            key = make_key(prefix, bound.arguments["requirements"])
+            # Where semantic matches are looked up and stored: (platform, scope)
+            target = (platform, make_scope(prefix))
+            if _bypass:
+                return key, target, None
+
+            try:
+                return key, target, get_cache().get(key)
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️  WARNING: Response cache lookup failed ({e})")
+                return key, target, None
+
+        def semantic_lookup(args, kwargs, target: Tuple[str, str]):
+            bound = signature.bind(*args, **kwargs)
+            return _semantic_lookup(get_cache(), bound.arguments["self"], method, *target,
+                                    bound.arguments["requirements"])
+
+        def store(key: str, target: Tuple[str, str], vector: Optional[List[float]], response: str):
+            # The response is already paid for: a cache failure must not lose it
+            cache = get_cache()
+            try:
+                cache.set(key, response)
+                if vector is not None:
+                    cache.add_embedding(key, method, *target, vector)
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️  WARNING: Response not cached ({e})")
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # sqlite calls run in worker threads so a slow or locked database
+                # never stalls other generations sharing the event loop
+                if await asyncio.to_thread(get_cache) is None:
+                    return await func(*args, **kwargs)
+
+                key, target, cached = await asyncio.to_thread(lookup, args, kwargs)
+                if cached is not None:
+                    print("♻️  Using cached response")
+                    return cached
+
+                vector = None
+                if SEMANTIC_CACHE_THRESHOLD > 0:
+                    vector, cached = await asyncio.to_thread(semantic_lookup, args, kwargs, target)
+                    if cached is not None:
+                        print("♻️  Using cached response for similar requirements")
+                        return cached
+
+                response = await func(*args, **kwargs)
+                await asyncio.to_thread(store, key, target, vector, response)
+                return response
+
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if get_cache() is None:
+                    yield from func(*args, **kwargs)
+                    return
+
+                key, target, cached = lookup(args, kwargs)
+                if cached is not None:
+                    print("♻️  Using cached response")
+                    yield cached
+                    return
+
+                vector = None
+                if SEMANTIC_CACHE_THRESHOLD > 0:
+                    vector, cached = semantic_lookup(args, kwargs, target)
+                    if cached is not None:
+                        print("♻️  Using cached response for similar requirements")
+                        yield cached
+                        return
+
+                # Only a fully consumed stream is stored
+                chunks = []
+                for chunk in func(*args, **kwargs):
+                    chunks.append(chunk)
+                    yield chunk
+                store(key, target, vector, "".join(chunks))
+
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_cache() is None:
+                return func(*args, **kwargs)
+
+            key, target, cached = lookup(args, kwargs)
+            if cached is not None:
+                print("♻️  Using cached response")
+                return cached
+
+            vector = None
+            if SEMANTIC_CACHE_THRESHOLD > 0:
+                vector, cached = semantic_lookup(args, kwargs, target)
+                if cached is not None:
+                    print("♻️  Using cached response for similar requirements")
+                    return cached
+
+            response = func(*args, **kwargs)
+            store(key, target, vector, response)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,71 @@
+"""Requirement templates for the CLI commands, compiled once at import"""
+
+from string import Template
+
+# Kubernetes deployment requirements for generate-k8s
+K8S_TEMPLATE = Template("""
+    Generate Kubernetes deployment for:
+    - Application type: $app
+    - Number of replicas: $replicas
+    - Container port: $port
+    - Memory limit: $memory
+    - CPU limit: $cpu
+    
+    Requirements:
+    - Include LoadBalancer Service for external access
+    - Add ConfigMap for environment variables
+    - Implement health checks (liveness and readiness probes)
+    - Apply security best practices (non-root user, read-only filesystem)
+    - Add resource requests and limits
+    - Include proper labels and selectors
+    """)
+
+# Terraform requirements for generate-terraform
+TERRAFORM_TEMPLATE = Template("""
+    Generate Terraform code for $cloud_upper infrastructure:
+    - Cloud provider: $cloud
+    - Service: $service
+    - Region: $region
+    
+    Requirements:
+    - Create VPC with public and private subnets
+    - Set up Internet Gateway and NAT Gateway
+    - Configure security groups with least privilege
+    - Enable encryption at rest
+    - Include proper tagging
+    - Use variables for configurable values
+    - Add outputs for important resource IDs
+    """)
+
+# Dockerfile requirements for generate-docker
+DOCKER_TEMPLATE = Template("""
+    Generate optimized Dockerfile for $app application:
+    - Application type: $app
+    $base_image_instruction
+    - Exposed port: $port
+    
+    Requirements:
+    - Use multi-stage build for optimization
+    - Run as non-root user
+    - Use minimal base image (alpine or slim variants)
+    - Implement layer caching best practices
+    - Add HEALTHCHECK
+    - Include security best practices
+    - Optimize for small image size
+    """)
+
+# CI/CD pipeline requirements for generate-cicd
+CICD_TEMPLATE = Template("""
+    Generate $platform_upper CI/CD pipeline for:
+    - Platform: $platform
+    - Deployment target: $deploy_target
+    
+    Requirements:
+    - Build stage: Build and test application
+    - Docker stage: Build and push Docker image
+    - Deploy stage: Deploy to $deploy_target
+    - Include caching for dependencies
+    - Add proper secrets management
+    - Implement parallel execution where possible
+    - Add status badges
+    """)
@@ -0,0 +1,36 @@
+"""Text helpers for cleaning up AI output"""
+
+import re
+from typing import Callable, Iterable, Iterator
+
+# Markdown code fences, with or without a language tag (```yaml, ```hcl, ```)
+_FENCE_RE = re.compile(r'```[a-zA-Z]*\n?')
+
+
+def strip_fences(text: str) -> str:
+    """
+    Remove markdown code fences in a single pass and trim surrounding whitespace
+
+    Args:
+        text: Raw AI output
+
+    Returns:
+        str: Cleaned text
+    """
+    return _FENCE_RE.sub('', text).strip()
+
+
+def echo_stream(chunks: Iterable[str], on_chunk: Callable[[str], None]) -> Iterator[str]:
+    """
+    Pass streamed AI output through unchanged, handing each chunk to a callback first
+
+    Args:
+        chunks: Text chunks of the raw AI output
+        on_chunk: Called with every chunk as it arrives (e.g. to echo it)
+
+    Yields:
+        str: The same chunks
+    """
+    for chunk in chunks:
+        on_chunk(chunk)
+        yield chunk
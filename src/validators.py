@@ -1,122 +1,564 @@
 """Validation system for generated infrastructure code"""
 
+import asyncio
+import hashlib
+import os
+import threading
+import types
 import yaml
 import re
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _dumps(record: dict) -> bytes:
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Parsed YAML for recently validated content, keyed by a digest of the text
+_YAML_CACHE_SIZE = 128
+_yaml_cache: "OrderedDict[bytes, Tuple[bool, Any]]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+# Results of recent validate_generated_code calls, keyed by code type and content digest
+_RESULT_CACHE_SIZE = 512
+_result_cache: "OrderedDict[Tuple[str, bytes], ValidationResult]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# Top-level fields every Kubernetes manifest must have
+_K8S_REQUIRED_FIELDS = ("apiVersion", "kind", "metadata")
+
+# Text mentioning none of these is rejected as a manifest without parsing it
+_K8S_PREFILTER_FIELDS = ("apiVersion", "kind")
+
+# Fields every manifest's metadata must have
+_K8S_METADATA_REQUIRED_FIELDS = ("name",)
+
+# Messages for missing fields, built once rather than formatted on every failure
+_MISSING_FIELD_ERRORS = {field: f"Missing required field: {field}" for field in _K8S_REQUIRED_FIELDS}
+_MISSING_METADATA_ERRORS = {
+    field: f"Missing required field: metadata.{field}" for field in _K8S_METADATA_REQUIRED_FIELDS
+}
+
+# Paths the manifest checks read; None means only the field's presence matters,
+# str means its value is kept when it is a string
+_K8S_FIELDS = {
+    "apiVersion": None,
+    "kind": str,
+    "metadata": {"name": None},
+    "spec": {
+        "replicas": None,
+        "ports": None,
+        "template": {"spec": {"securityContext": None}},
+    },
+}
+
+# Stands in for values the event walker skips without constructing them
+_UNREAD = object()
+
+# Returned by _deep_get when a path does not exist
+_MISSING = object()
+
+_NULL_TAG = "tag:yaml.org,2002:null"
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = yaml.resolver.Resolver()
+
+# Markers of the provider and terraform blocks in Terraform code
+_PROVIDER_TOKEN = 'provider "'
+_TERRAFORM_TOKEN = 'terraform {'
+
+# Below this many items validate_batch runs serially; worker start-up would cost more
+_BATCH_PARALLEL_THRESHOLD = 4
 
 
 class ValidationResult:
     """Container for validation results"""
     
+    __slots__ = ("valid", "_errors", "_warnings", "_suggestions")
+    
     def __init__(self):
         self.valid = True
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.suggestions: List[str] = []
+        # Most results stay empty, so lists are only created by the first add_*
+        self._errors: Sequence[str] = ()
+        self._warnings: Sequence[str] = ()
+        self._suggestions: Sequence[str] = ()
+    
+    @property
+    def errors(self) -> Sequence[str]:
+        """Error messages"""
+        return self._errors
+    
+    @property
+    def warnings(self) -> Sequence[str]:
+        """Warning messages"""
+        return self._warnings
+    
+    @property
+    def suggestions(self) -> Sequence[str]:
+        """Suggestions"""
+        return self._suggestions
     
     def add_error(self, message: str):
         """Add an error message"""
         self.valid = False
-        self.errors.append(message)
+        if not self._errors:
+            self._errors = []
+        self._errors.append(message)
     
     def add_warning(self, message: str):
         """Add a warning message"""
-        self.warnings.append(message)
+        if not self._warnings:
+            self._warnings = []
+        self._warnings.append(message)
     
     def add_suggestion(self, message: str):
         """Add a suggestion"""
-        self.suggestions.append(message)
+        if not self._suggestions:
+            self._suggestions = []
+        self._suggestions.append(message)
+    
+    def merge(self, other: "ValidationResult", prefix: str = ""):
+        """
+        Add another result's messages to this one
+        
+        Args:
+            other: Result to take the messages from
+            prefix: Prepended to every message taken
+        """
+        for message in other.errors:
+            self.add_error(prefix + message)
+        for message in other.warnings:
+            self.add_warning(prefix + message)
+        for message in other.suggestions:
+            self.add_suggestion(prefix + message)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationResult":
+        """
+        Build a result from the output of to_dict
+        
+        Args:
+            data: Dictionary with valid, errors, warnings and suggestions
+        
+        Returns:
+            ValidationResult: New result holding the same messages
+        """
+        result = cls()
+        for message in data.get("errors", ()):
+            result.add_error(message)
+        for message in data.get("warnings", ()):
+            result.add_warning(message)
+        for message in data.get("suggestions", ()):
+            result.add_suggestion(message)
+        result.valid = data.get("valid", result.valid)
+        return result
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
         return {
             "valid": self.valid,
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "suggestions": self.suggestions,
+            "errors": list(self._errors),
+            "warnings": list(self._warnings),
+            "suggestions": list(self._suggestions),
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON, without copying the message lists"""
+        return _dumps({
+            "valid": self.valid,
+            "errors": self._errors,
+            "warnings": self._warnings,
+            "suggestions": self._suggestions,
+        })
 
 
-def validate_yaml_syntax(content: str) -> ValidationResult:
+def _cached_parse(content: str, namespace: bytes, parse: Callable[[str], Any]) -> Tuple[bool, Any]:
     """
-    Validate YAML syntax
+    Run a YAML parse, reusing the result for content that was parsed recently
+    
+    The cache is keyed by a short digest rather than the text itself, so
+    large manifests are not kept alive by it.
     
     Args:
         content: YAML content as string
+        namespace: Keeps the results of different parse functions apart
+        parse: Function turning the content into the cached value
     
     Returns:
-        ValidationResult: Validation results
+        Tuple[bool, Any]: (True, parse result) or (False, error message)
     """
-    result = ValidationResult()
+    key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16, person=namespace).digest()
+    
+    with _yaml_cache_lock:
+        parsed = _yaml_cache.get(key)
+        if parsed is not None:
+            _yaml_cache.move_to_end(key)
+            return parsed
     
     try:
-        yaml.safe_load(content)
+        parsed = (True, parse(content))
     except yaml.YAMLError as e:
-        result.add_error(f"YAML syntax error: {str(e)}")
+        parsed = (False, str(e))
     
-    return result
+    with _yaml_cache_lock:
+        _yaml_cache[key] = parsed
+        _yaml_cache.move_to_end(key)
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    
+    return parsed
+
+
+def _load_documents(content: str) -> List[Any]:
+    """Construct every document in the YAML stream"""
+    return list(yaml.load_all(content, Loader=_SafeLoader))
+
+
+def _check_documents(content: str) -> None:
+    """Construct every document in the YAML stream, keeping none of them"""
+    for _ in yaml.load_all(content, Loader=_SafeLoader):
+        pass
+
+
+def _parse_yaml(content: str) -> Tuple[bool, Any]:
+    """
+    Check YAML syntax, reusing the verdict for content that was checked recently
+    
+    Only the verdict is cached; the documents are dropped once constructed.
+    
+    Args:
+        content: YAML content as string
+    
+    Returns:
+        Tuple[bool, Any]: (True, None) or (False, error message)
+    """
+    return _cached_parse(content, b"syntax", _check_documents)
+
+
+class _NeedsFullLoad(Exception):
+    """The YAML uses anchors, aliases, tags, merge keys or complex keys, which the event walker does not model"""
+
+
+def _next_event(events: Iterator[yaml.Event]) -> yaml.Event:
+    """Get the next parser event, bailing out on features only the full loader handles"""
+    event = next(events)
+    if getattr(event, "anchor", None) is not None or getattr(event, "tag", None) is not None:
+        raise _NeedsFullLoad
+    # A plain `<<` is a merge key, which pulls in keys from another mapping
+    if isinstance(event, yaml.ScalarEvent) and event.value == "<<" and event.implicit[0]:
+        raise _NeedsFullLoad
+    return event
+
+
+def _skip_node(events: Iterator[yaml.Event], event: yaml.Event):
+    """
+    Consume the node starting at event without constructing it
+    
+    Mapping keys are still checked to be scalars, as the full loader
+    would reject collection keys.
+    
+    Args:
+        events: Parser events following event
+        event: First event of the node
+    """
+    # One entry per open collection: None for a sequence, else whether a key comes next
+    open_collections = []
+    
+    while True:
+        if isinstance(event, yaml.CollectionStartEvent):
+            if open_collections and open_collections[-1]:
+                raise _NeedsFullLoad
+            open_collections.append(True if isinstance(event, yaml.MappingStartEvent) else None)
+        else:
+            if isinstance(event, yaml.CollectionEndEvent):
+                open_collections.pop()
+            
+            if not open_collections:
+                return
+            if open_collections[-1] is not None:
+                open_collections[-1] = not open_collections[-1]
+        
+        event = _next_event(events)
+
+
+def _skim_node(events: Iterator[yaml.Event], fields: Any) -> Any:
+    """
+    Read the next node, constructing only the parts named in fields
+    
+    Args:
+        events: Parser events
+        fields: Part of _K8S_FIELDS describing this node
+    
+    Returns:
+        Dict of the wanted keys for a wanted mapping, None for a null scalar,
+        the value of a wanted string, otherwise _UNREAD
+    """
+    event = _next_event(events)
+    
+    if isinstance(event, yaml.MappingStartEvent) and isinstance(fields, dict):
+        node = {}
+        while True:
+            key = _next_event(events)
+            if isinstance(key, yaml.MappingEndEvent):
+                return node
+            if not isinstance(key, yaml.ScalarEvent):
+                raise _NeedsFullLoad
+            
+            if key.value in fields:
+                node[key.value] = _skim_node(events, fields[key.value])
+            else:
+                _skip_node(events, _next_event(events))
+    
+    if isinstance(event, yaml.ScalarEvent):
+        tag = _resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag == _NULL_TAG:
+            return None
+        if fields is str and tag == _STR_TAG:
+            return event.value
+        return _UNREAD
+    
+    _skip_node(events, event)
+    return _UNREAD
+
+
+def _extract_k8s_fields(content: str) -> List[Any]:
+    """
+    Pull the fields the manifest checks need out of every YAML document
+    
+    Walks libyaml's event stream instead of building the whole object tree,
+    so container specs, config data and the like are never turned into
+    Python objects.
+    
+    Args:
+        content: YAML content as string
+    
+    Returns:
+        List[Any]: One skeleton per document, shaped like _K8S_FIELDS
+    """
+    events = iter(yaml.parse(content, Loader=_SafeLoader))
+    documents = []
+    
+    for event in events:
+        if isinstance(event, yaml.DocumentStartEvent):
+            documents.append(_skim_node(events, _K8S_FIELDS))
+    
+    return documents
+
+
+def _parse_manifests(content: str) -> Tuple[bool, Any]:
+    """
+    Parse Kubernetes manifests far enough for validate_kubernetes_manifest
+    
+    Args:
+        content: YAML content as string
+    
+    Returns:
+        Tuple[bool, Any]: (True, list of documents) or (False, error message)
+    """
+    return _cached_parse(content, b"k8s-fields", _manifest_documents)
+
+
+def _manifest_documents(content: str) -> List[Any]:
+    """Skim the documents with the event walker, falling back to the full loader"""
+    try:
+        return _extract_k8s_fields(content)
+    except _NeedsFullLoad:
+        # Cut fully loaded documents down to the same skeletons before they are cached
+        return [_project(document, _K8S_FIELDS) for document in _load_documents(content)]
+
+
+def _project(node: Any, fields: Any) -> Any:
+    """
+    Reduce a fully loaded node to what _skim_node would have returned for it
+    
+    Args:
+        node: Parsed YAML node
+        fields: Part of _K8S_FIELDS describing this node
+    
+    Returns:
+        Dict of the wanted keys for a wanted mapping, None for null, the value
+        of a wanted string, otherwise _UNREAD
+    """
+    if node is None:
+        return None
+    if isinstance(node, dict) and isinstance(fields, dict):
+        return {key: _project(node[key], fields[key]) for key in fields if key in node}
+    if fields is str and isinstance(node, str):
+        return node
+    return _UNREAD
+
+
+def _safe_load(content: str,
+               parse: Callable[[str], Tuple[bool, Any]] = _parse_yaml) -> Tuple[ValidationResult, Optional[List[Any]]]:
+    """
+    Parse YAML once for both the syntax check and any structure checks
+    
+    Args:
+        content: YAML content as string
+        parse: Cached parse function (_parse_yaml or _parse_manifests)
+    
+    Returns:
+        Tuple[ValidationResult, Optional[List[Any]]]: The syntax check result and
+        what parse produced (None for _parse_yaml), or None when the YAML is invalid
+    """
+    result = ValidationResult()
+    
+    ok, parsed = parse(content)
+    if not ok:
+        result.add_error(f"YAML syntax error: {parsed}")
+        return result, None
+    
+    return result, parsed
+
+
+def validate_yaml_syntax(content: str) -> ValidationResult:
+    """
+    Validate YAML syntax
+    
+    Args:
+        content: YAML content as string
+    
+    Returns:
+        ValidationResult: Validation results
+    """
+    return _safe_load(content)[0]
 
 
 def validate_kubernetes_manifest(content: str) -> ValidationResult:
     """
     Validate Kubernetes manifest structure
     
+    Content that mentions neither apiVersion nor kind cannot be a
+    manifest; it is rejected with the missing-field errors without being
+    parsed, so YAML syntax is not checked for it.
+    
     Args:
         content: YAML content as string
     
     Returns:
         ValidationResult: Validation results
     """
-    result = validate_yaml_syntax(content)
+    if not any(field in content for field in _K8S_PREFILTER_FIELDS):
+        result = ValidationResult()
+        for field in _K8S_REQUIRED_FIELDS:
+            if field not in content:
+                result.add_error(_MISSING_FIELD_ERRORS[field])
+        return result
     
-    if not result.valid:
+    result, documents = _safe_load(content, _parse_manifests)
+    if documents is None:
         return result
     
-    try:
-        manifest = yaml.safe_load(content)
-        
-        # Check required fields
-        if "apiVersion" not in manifest:
-            result.add_error("Missing required field: apiVersion")
-        
-        if "kind" not in manifest:
-            result.add_error("Missing required field: kind")
-        
-        if "metadata" not in manifest:
-            result.add_error("Missing required field: metadata")
-        
-        # Check metadata
-        if "metadata" in manifest:
-            if "name" not in manifest["metadata"]:
-                result.add_error("Missing required field: metadata.name")
-        
-        # Kind-specific validation
-        kind = manifest.get("kind", "")
-        
-        if kind == "Deployment":
-            if "spec" not in manifest:
-                result.add_error("Deployment missing spec field")
-            elif "replicas" not in manifest["spec"]:
-                result.add_warning("Deployment spec missing replicas (will default to 1)")
-            
-            # Check for security context
-            if "spec" in manifest and "template" in manifest["spec"]:
-                template_spec = manifest["spec"]["template"].get("spec", {})
-                if "securityContext" not in template_spec:
-                    result.add_suggestion("Consider adding securityContext for pod security")
-        
-        elif kind == "Service":
-            if "spec" not in manifest:
-                result.add_error("Service missing spec field")
-            elif "ports" not in manifest["spec"]:
-                result.add_error("Service spec missing ports")
+    # Check every document, as `kubectl apply -f` applies each of them (empty ones are skipped)
+    manifests = [document for document in documents if document is not None] or [None]
+    
+    if len(manifests) == 1:
+        _check_manifest(manifests[0], result)
+        return result
     
-    except Exception as e:
-        result.add_error(f"Validation error: {str(e)}")
+    for index, manifest in enumerate(manifests, 1):
+        document_result = ValidationResult()
+        _check_manifest(manifest, document_result)
+        result.merge(document_result, f"Document {index}: ")
     
     return result
 
 
+def _check_manifest(manifest: Any, result: ValidationResult):
+    """
+    Check the structure of one parsed Kubernetes manifest
+    
+    Args:
+        manifest: Parsed YAML document
+        result: Result to add errors, warnings and suggestions to
+    """
+    if not isinstance(manifest, dict):
+        result.add_error("Manifest must be a YAML mapping")
+        return
+    
+    # Check required fields
+    for field in _K8S_REQUIRED_FIELDS:
+        if field not in manifest:
+            result.add_error(_MISSING_FIELD_ERRORS[field])
+    
+    # Check metadata
+    if "metadata" in manifest:
+        metadata = manifest["metadata"]
+        if not isinstance(metadata, dict):
+            metadata = {}
+        for field in _K8S_METADATA_REQUIRED_FIELDS:
+            if field not in metadata:
+                result.add_error(_MISSING_METADATA_ERRORS[field])
+    
+    # Kind-specific validation
+    kind = manifest.get("kind")
+    validator = _KIND_VALIDATORS.get(kind) if isinstance(kind, str) else None
+    if validator is not None:
+        validator(manifest, result)
+
+
+def _deep_get(node: Any, path: Tuple[str, ...]) -> Any:
+    """
+    Follow a path of mapping keys through parsed YAML
+    
+    Args:
+        node: Parsed YAML node to start from
+        path: Keys to follow
+    
+    Returns:
+        Any: The value at the path, or _MISSING if a key is absent or a step is not a mapping
+    """
+    for key in path:
+        if not isinstance(node, dict):
+            return _MISSING
+        node = node.get(key, _MISSING)
+    return node
+
+
+def _validate_deployment(manifest: dict, result: ValidationResult):
+    """Check the spec of a Deployment manifest"""
+    spec = manifest.get("spec")
+    
+    if not isinstance(spec, dict):
+        result.add_error("Deployment missing spec field")
+    elif "replicas" not in spec:
+        result.add_warning("Deployment spec missing replicas (will default to 1)")
+    
+    # Check for security context
+    template = _deep_get(spec, ("template",))
+    if isinstance(template, dict) and _deep_get(template, ("spec", "securityContext")) is _MISSING:
+        result.add_suggestion("Consider adding securityContext for pod security")
+
+
+def _validate_service(manifest: dict, result: ValidationResult):
+    """Check the spec of a Service manifest"""
+    spec = manifest.get("spec")
+    
+    if not isinstance(spec, dict):
+        result.add_error("Service missing spec field")
+    elif "ports" not in spec:
+        result.add_error("Service spec missing ports")
+
+
+# Checks for specific manifest kinds; other kinds only get the common checks
+_KIND_VALIDATORS = {
+    "Deployment": _validate_deployment,
+    "Service": _validate_service,
+}
+
+
 def validate_terraform_syntax(content: str) -> ValidationResult:
     """
     Basic Terraform syntax validation
@@ -129,29 +571,58 @@ def validate_terraform_syntax(content: str) -> ValidationResult:
     """
     result = ValidationResult()
     
-    # Check for basic HCL structure
-    if not content.strip():
+    # Check for basic HCL structure (without copying the content to strip it)
+    if not content or content.isspace():
         result.add_error("Empty Terraform file")
         return result
     
-    # Check for balanced braces
     open_braces = content.count('{')
     close_braces = content.count('}')
+    has_provider = _PROVIDER_TOKEN in content
+    has_terraform_block = _TERRAFORM_TOKEN in content
     
+    # Check for balanced braces
     if open_braces != close_braces:
         result.add_error(f"Unbalanced braces: {open_braces} opening, {close_braces} closing")
     
     # Check for provider block
-    if 'provider "' not in content:
+    if not has_provider:
         result.add_warning("No provider block found")
     
     # Check for terraform block
-    if 'terraform {' not in content:
+    if not has_terraform_block:
         result.add_suggestion("Consider adding terraform block with required_version")
     
     return result
 
 
+def _find_instruction(content: str, instruction: str, start: int = 0) -> int:
+    """
+    Find the first Dockerfile line that starts with an instruction
+    
+    Args:
+        content: Dockerfile content as string
+        instruction: Instruction keyword (FROM, COPY, RUN)
+        start: Offset to search from
+    
+    Returns:
+        int: Offset of the start of the line, or -1 if no line starts with the instruction
+    """
+    while True:
+        pos = content.find(instruction, start)
+        if pos == -1:
+            return -1
+        
+        line_start = content.rfind('\n', 0, pos) + 1
+        if content[line_start:pos + len(instruction)].lstrip().startswith(instruction):
+            return line_start
+        
+        # Only mentioned mid-line (e.g. in a comment or command): move past this line
+        start = content.find('\n', pos) + 1
+        if start == 0:
+            return -1
+
+
 def validate_dockerfile(content: str) -> ValidationResult:
     """
     Validate Dockerfile
@@ -164,15 +635,13 @@ def validate_dockerfile(content: str) -> ValidationResult:
     """
     result = ValidationResult()
     
-    lines = content.strip().split('\n')
+    # Jump between occurrences of each instruction instead of splitting every line
+    has_from = _find_instruction(content, 'FROM') > -1
+    run_index = _find_instruction(content, 'RUN')
+    # Only whether some COPY follows the first RUN matters, so stop at the first one
+    copy_after_run = run_index > -1 and _find_instruction(content, 'COPY', run_index + 1) > -1
     
     # Check for FROM instruction
-    has_from = False
-    for line in lines:
-        if line.strip().startswith('FROM'):
-            has_from = True
-            break
-    
     if not has_from:
         result.add_error("Dockerfile must start with FROM instruction")
     
@@ -185,25 +654,27 @@ def validate_dockerfile(content: str) -> ValidationResult:
         result.add_suggestion("Consider adding USER instruction to run as non-root")
     
     # Check for COPY before RUN (layer caching)
-    copy_index = -1
-    run_index = -1
-    
-    for i, line in enumerate(lines):
-        if line.strip().startswith('COPY'):
-            copy_index = i
-        elif line.strip().startswith('RUN') and run_index == -1:
-            run_index = i
-    
-    if copy_index > -1 and run_index > -1 and copy_index > run_index:
+    if copy_after_run:
         result.add_suggestion("Consider copying dependency files before RUN for better layer caching")
     
     return result
 
 
+# Routing table for validate_generated_code; anything else gets the YAML syntax check
+_VALIDATORS = types.MappingProxyType({
+    "kubernetes": validate_kubernetes_manifest,
+    "terraform": validate_terraform_syntax,
+    "docker": validate_dockerfile,
+})
+
+
 def validate_generated_code(content: str, code_type: str) -> ValidationResult:
     """
     Main validation function that routes to specific validators
     
+    Validation is pure, so results for recently seen content are reused;
+    each caller gets its own copy.
+    
     Args:
         content: Code content as string
         code_type: Type of code (kubernetes, terraform, docker)
@@ -211,11 +682,81 @@ def validate_generated_code(content: str, code_type: str) -> ValidationResult:
     Returns:
         ValidationResult: Validation results
     """
-    validators = {
-        "kubernetes": validate_kubernetes_manifest,
-        "terraform": validate_terraform_syntax,
-        "docker": validate_dockerfile,
-    }
+    key = (code_type, hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+    
+    if cached is None:
+        cached = _VALIDATORS.get(code_type, validate_yaml_syntax)(content)
+        
+        with _result_cache_lock:
+            _result_cache[key] = cached
+            _result_cache.move_to_end(key)
+            if len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    
+    return ValidationResult.from_dict(cached.to_dict())
+
+
+def _validate_one(item: Tuple[str, str]) -> ValidationResult:
+    """Validate one (content, code_type) pair; top-level so worker processes can pickle it"""
+    content, code_type = item
+    return validate_generated_code(content, code_type)
+
+
+def validate_batch(items: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[ValidationResult]:
+    """
+    Validate many generated files, in parallel worker processes for larger batches
+    
+    Args:
+        items: (content, code_type) pairs, as taken by validate_generated_code
+        max_workers: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        List[ValidationResult]: Results in the same order as items
+    """
+    if len(items) < _BATCH_PARALLEL_THRESHOLD:
+        return [_validate_one(item) for item in items]
+    
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(items) // (workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_validate_one, items, chunksize=chunksize))
+
+
+async def validate_generated_code_async(content: str, code_type: str) -> ValidationResult:
+    """
+    Validate generated code in a worker thread so the event loop stays responsive
+    
+    Args:
+        content: Code content as string
+        code_type: Type of code (kubernetes, terraform, docker)
+    
+    Returns:
+        ValidationResult: Validation results
+    """
+    return await asyncio.to_thread(validate_generated_code, content, code_type)
+
+
+async def validate_many_async(items: List[Tuple[str, str]], max_concurrency: int = 50) -> List[ValidationResult]:
+    """
+    Validate many generated files from async code
+    
+    Args:
+        items: (content, code_type) pairs, as taken by validate_generated_code
+        max_concurrency: Most validations running at once
+    
+    Returns:
+        List[ValidationResult]: Results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def validate(content: str, code_type: str) -> ValidationResult:
+        async with semaphore:
+            return await validate_generated_code_async(content, code_type)
     
-    validator = validators.get(code_type, validate_yaml_syntax)
-    return validator(content)
+    return await asyncio.gather(*(validate(content, code_type) for content, code_type in items))